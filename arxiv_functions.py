@@ -11,7 +11,7 @@ Sharmin, and Jacqueline Smith.
 """
 
 import copy  # needed in examples of functions that modify input dict
-from typing import TextIO, Tuple
+from typing import Iterator, TextIO, Tuple
 
 from constants import (ID, TITLE, CREATED, MODIFIED, AUTHORS, ABSTRACT, END,
                        NameType, ArticleValueType, ArticleType, ArxivType)
@@ -115,12 +115,23 @@ def created_in_year(data: ArxivType, id: str, year: int) -> bool:
     return True
 
 
+def created_in_years(data: ArxivType, ids: list[str],
+                     year: int) -> dict[str, bool]:
+    """Return a dict that maps each ID in ids to created_in_year(data, id,
+    year).
+
+    >>> created_in_years(EXAMPLE_ARXIV, ['0001', '5090', '999'], 2023)
+    {'0001': True, '5090': False, '999': False}
+    """
+    return {id: created_in_year(data, id, year) for id in ids}
+
+
 def contains_keyword(arxiv_data: ArxivType, keyword: str) -> list[str]:
     """
     Return a list of the IDs of articles of arxiv_data that contain the given
     keyword in their title, author names, and/or abstract. The list should be
     sorted in lexicographic order.
-    >>> contains_keyword(EXAMPLE_ARXIV, 'cat')
+    >>> contains_keyword(EXAMPLE_ARXIV, 'cats')
     ['0001']
     >>> contains_keyword(EXAMPLE_ARXIV, 'engagement')
     ['5090']
@@ -129,19 +140,78 @@ def contains_keyword(arxiv_data: ArxivType, keyword: str) -> list[str]:
     keyword = clean_word(keyword)  # Clean the keyword first
 
     for article_id, article_info in arxiv_data.items():
-        title = clean_word(article_info[TITLE])
-        abstract = clean_word(article_info[ABSTRACT])
-        authors = ' '.join(
-            [' '.join(author) for author in article_info[AUTHORS]])
-        authors = clean_word(authors)
-
-        if keyword in title.split() or keyword in abstract.split() or \
-                keyword in authors.split():
+        if keyword in article_words(article_info):
             matching_ids.append(article_id)
 
     return sorted(matching_ids)
 
 
+def contains_keywords(arxiv_data: ArxivType,
+                      keywords: list[str]) -> dict[str, list[str]]:
+    """Return a dict that maps each keyword in keywords to
+    contains_keyword(arxiv_data, keyword), computed in a single pass over
+    arxiv_data.
+
+    >>> contains_keywords(EXAMPLE_ARXIV, ['Cats', 'we', 'robot'])
+    {'Cats': ['0001'], 'we': ['0001', '03221', '108'], 'robot': ['03221']}
+    """
+    matches = {}
+    for keyword in keywords:
+        matches[clean_word(keyword)] = []
+
+    for article_id, article_info in arxiv_data.items():
+        for word in article_words(article_info):
+            if word in matches:
+                matches[word].append(article_id)
+
+    for ids in matches.values():
+        ids.sort()
+    return {keyword: list(matches[clean_word(keyword)])
+            for keyword in keywords}
+
+
+def article_words(article: ArticleType) -> set[str]:
+    """Return the set of words in the title, author names and abstract of
+    article, each cleaned with clean_word. Words that are empty once cleaned
+    are left out.
+
+    >>> sorted(article_words(EXAMPLE_ARXIV['03221']))[:4]
+    ['a', 'an', 'approach', 'assisting']
+    >>> 'grossman' in article_words(EXAMPLE_ARXIV['03221'])
+    True
+    """
+    words = set(text_words(article))
+    for author in article[AUTHORS]:
+        words.update(_clean_words(' '.join(author)))
+    return words
+
+
+def text_words(article: ArticleType) -> list[str]:
+    """Return the words of the title and then the abstract of article, in
+    order and with repeats, each cleaned with clean_word. Words that are
+    empty once cleaned are left out.
+
+    >>> text_words({TITLE: 'Cats, cats!', ABSTRACT: "and -- dogs"})
+    ['cats', 'cats', 'and', 'dogs']
+    """
+    return _clean_words(article[TITLE] + ' ' + article[ABSTRACT])
+
+
+def _clean_words(text: str) -> list[str]:
+    """Return the whitespace-separated words of text, each cleaned with
+    clean_word, leaving out words that are empty once cleaned.
+
+    >>> _clean_words("Don't  panic!")
+    ['dont', 'panic']
+    """
+    words = []
+    for word in text.split():
+        word = clean_word(word)
+        if word:
+            words.append(word)
+    return words
+
+
 def average_author_count(arxiv_data: ArxivType) -> float:
     """
     Return the average number of authors per article in the arxiv metadata.
@@ -202,6 +272,50 @@ def read_arxiv_file(f: TextIO) -> ArxivType:
     return arxiv_data
 
 
+def read_arxiv_records(f: TextIO) -> Iterator[ArticleType]:
+    """Yield the articles in f one at a time, in file order, without
+    building the whole ArxivType dictionary.
+
+    Each record is an ID line, a title line, a CREATED line, a MODIFIED line,
+    one "last,first" line per author, a blank line, and then the abstract
+    (which may itself contain blank lines), terminated by an END line.
+    Author names are NameType (last-name, first-name(s)) and abstract lines
+    are joined with newlines, as in EXAMPLE_ARXIV.
+    """
+    lines = []
+    for line in f:
+        line = line.strip()
+        if line == END:
+            yield _record_to_article(lines)
+            lines = []
+        else:
+            lines.append(line)
+
+
+def _record_to_article(lines: list[str]) -> ArticleType:
+    """Return the article described by lines, the lines of one record of an
+    arxiv metadata file without its END line.
+
+    >>> article = _record_to_article(['108', 'CSC108', '2023-09-01', '',
+    ...                               'Smith,Jen', 'Campbell, Jo', '',
+    ...                               'First line', '', 'Last line'])
+    >>> article[AUTHORS]
+    [('Smith', 'Jen'), ('Campbell', 'Jo')]
+    >>> article[ABSTRACT].splitlines()
+    ['First line', '', 'Last line']
+    """
+    lines = lines + [''] * (4 - len(lines))
+    authors = []
+    i = 4
+    while i < len(lines) and lines[i]:
+        last_name, first_name = lines[i].split(',', 1)
+        authors.append((last_name.strip(), first_name.strip()))
+        i = i + 1
+    return {ID: lines[0], TITLE: lines[1], CREATED: lines[2],
+            MODIFIED: lines[3], AUTHORS: authors,
+            ABSTRACT: '\n'.join(lines[i + 1:])}
+
+
 def parse_author(line: str) -> Tuple[str, str]:
     """
     Parse an author's name from a line.
@@ -264,6 +378,32 @@ def get_coauthors(arxiv_data: ArxivType, author: NameType) -> list[NameType]:
     return sorted(list(coauthors))
 
 
+def get_coauthors_many(arxiv_data: ArxivType, authors: list[NameType]
+                       ) -> dict[NameType, list[NameType]]:
+    """Return a dict that maps each author in authors to
+    get_coauthors(arxiv_data, author), computed in a single pass over
+    arxiv_data.
+
+    >>> result = get_coauthors_many(EXAMPLE_ARXIV, [('Sharmin', 'Sadia'),
+    ...                                             ('Robin', 'Lin')])
+    >>> result[('Sharmin', 'Sadia')]
+    [('Smith', 'Jacqueline E.')]
+    >>> result[('Robin', 'Lin')]
+    []
+    """
+    coauthors = {}
+    for author in authors:
+        coauthors[author] = set()
+
+    for article_info in arxiv_data.values():
+        for author in article_info[AUTHORS]:
+            if author in coauthors:
+                coauthors[author].update(article_info[AUTHORS])
+
+    return {author: sorted(coauthors[author] - {author})
+            for author in authors}
+
+
 
 
 
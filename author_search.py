@@ -0,0 +1,151 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Free-text author lookup. Resolves what a user types, such as "smith j" or
+"chablat", to the exact NameType entries used as keys by get_coauthors and
+make_author_to_articles.
+"""
+
+import bisect
+import unicodedata
+from typing import Optional
+
+from constants import AUTHORS, NameType, ArticleType, ArxivType
+
+
+class AuthorIndex:
+    """An index of author names by normalized last name.
+
+    _keys is the list of distinct normalized last names, searched with
+    bisect for prefix matches. New last names are appended, and the list is
+    sorted once before the next search rather than on every insert;
+    _keys_sorted is True iff it is sorted now. _by_key maps each normalized
+    last name to the list of (normalized first-name words, author) pairs
+    with that last name.
+    """
+    _keys: list[str]
+    _keys_sorted: bool
+    _by_key: dict[str, list[tuple[list[str], NameType]]]
+
+    def __init__(self, arxiv_data: Optional[ArxivType] = None) -> None:
+        """Initialize an index of the authors in arxiv_data, if given."""
+        self._keys = []
+        self._keys_sorted = True
+        self._by_key = {}
+        if arxiv_data is not None:
+            for article in arxiv_data.values():
+                self.add_article(article)
+
+    def add_article(self, article: ArticleType) -> None:
+        """Add the authors of article to the index."""
+        for author in article[AUTHORS]:
+            self.add_author(author)
+
+    def add_author(self, author: NameType) -> None:
+        """Add author to the index, if it is not already there."""
+        key = ''.join(normalize_name(author[0]))
+        if key not in self._by_key:
+            self._keys.append(key)
+            self._keys_sorted = False
+            self._by_key[key] = []
+        entries = self._by_key[key]
+        if all(entry[1] != author for entry in entries):
+            entries.append((normalize_name(author[1]), author))
+
+    def search(self, query: str) -> list[NameType]:
+        """Return the authors matching the free-text name query.
+
+        A query is either "last, first" or words in either "last first" or
+        "first last" order. Matching ignores case, accents and punctuation.
+        The last name is matched as a prefix, and each first-name word must
+        be a prefix of the matching first-name word of the author, or have
+        it as an initial. Authors whose last name matches exactly come
+        first; each group is sorted in lexicographic order.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> index = AuthorIndex(EXAMPLE_ARXIV)
+        >>> index.search('smith j')
+        [('Smith', 'Jacqueline E.')]
+        >>> index.search('Jacqueline E Smith')
+        [('Smith', 'Jacqueline E.')]
+        >>> index.search('ZAVALETA')
+        [('Zavaleta-Bernuy', 'Angela')]
+        >>> index.search('s')
+        [('Sharmin', 'Sadia'), ('Smith', 'Jacqueline E.')]
+        """
+        if ',' in query:
+            last, first = query.split(',', 1)
+            splits = [(''.join(normalize_name(last)), normalize_name(first))]
+        else:
+            words = normalize_name(query)
+            splits = []
+            for i in range(1, len(words) + 1):
+                splits.append((''.join(words[:i]), words[i:]))
+                if i < len(words):
+                    splits.append((''.join(words[i:]), words[:i]))
+
+        exact = set()
+        partial = set()
+        for last, first in splits:
+            for key in self._keys_with_prefix(last):
+                matches = [author for first_words, author in self._by_key[key]
+                           if _first_names_match(first, first_words)]
+                if key == last:
+                    exact.update(matches)
+                else:
+                    partial.update(matches)
+        return sorted(exact) + sorted(partial - exact)
+
+    def _keys_with_prefix(self, prefix: str) -> list[str]:
+        """Return the normalized last names that start with prefix."""
+        if not prefix:
+            return []
+        if not self._keys_sorted:
+            self._keys.sort()
+            self._keys_sorted = True
+        start = bisect.bisect_left(self._keys, prefix)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(prefix):
+            end += 1
+        return self._keys[start:end]
+
+
+def normalize_name(name: str) -> list[str]:
+    """Return the words of name, case-folded, with accents removed and
+    punctuation treated as a word separator.
+
+    >>> normalize_name('Zavaleta-Bernuy')
+    ['zavaleta', 'bernuy']
+    >>> normalize_name('Jacqueline E.')
+    ['jacqueline', 'e']
+    >>> normalize_name('Erdős, Pál')
+    ['erdos', 'pal']
+    """
+    letters = []
+    for ch in unicodedata.normalize('NFKD', name).casefold():
+        if ch.isalpha():
+            letters.append(ch)
+        elif not unicodedata.combining(ch):
+            letters.append(' ')
+    return ''.join(letters).split()
+
+
+def _first_names_match(query_words: list[str],
+                       first_words: list[str]) -> bool:
+    """Return True iff each word of query_words matches the first-name word
+    of first_words in the same position. A query word matches if it is a
+    prefix of the name word, or if the name word is an initial of it.
+
+    >>> _first_names_match(['j'], ['jacqueline', 'e'])
+    True
+    >>> _first_names_match(['jacqueline'], ['j', 'e'])
+    True
+    >>> _first_names_match(['jo'], ['jacqueline'])
+    False
+    """
+    if len(query_words) > len(first_words):
+        return False
+    for query_word, first_word in zip(query_words, first_words):
+        if not (first_word.startswith(query_word) or
+                (len(first_word) == 1 and query_word[0] == first_word)):
+            return False
+    return True
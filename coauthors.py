@@ -0,0 +1,448 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Collaboration structure of the author graph, where two authors are joined
+when they wrote an article together.
+"""
+
+import bisect
+from typing import Iterator, Optional
+
+from constants import ID, CREATED, AUTHORS, NameType, ArticleType, ArxivType
+
+
+################################################################################
+# Collaboration clusters
+################################################################################
+class AuthorClusters:
+    """The connected components ("clusters") of the author graph, kept in a
+    union-find (disjoint-set) structure with union by size and path halving.
+
+    _parent maps each known author to its parent in the union-find forest;
+    a root is its own parent. _size maps each root to the number of authors
+    in its cluster.
+    """
+    _parent: dict[NameType, NameType]
+    _size: dict[NameType, int]
+
+    def __init__(self, arxiv_data: Optional[ArxivType] = None) -> None:
+        """Initialize the clusters of the authors in arxiv_data, if given.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> clusters = AuthorClusters(EXAMPLE_ARXIV)
+        >>> clusters.same_cluster(('Sharmin', 'Sadia'), ('Yanez', 'Fernando'))
+        True
+        >>> clusters.same_cluster(('Grossman', 'Tovi'), ('Campbell', 'Jen'))
+        False
+        >>> clusters.cluster_sizes()
+        [5, 1]
+        """
+        self._parent = {}
+        self._size = {}
+        if arxiv_data is not None:
+            for article in arxiv_data.values():
+                self.add_article(article)
+
+    def add_article(self, article: ArticleType) -> None:
+        """Merge the clusters of all authors of article."""
+        authors = article[AUTHORS]
+        for author in authors:
+            if author not in self._parent:
+                self._parent[author] = author
+                self._size[author] = 1
+        for author in authors[1:]:
+            self._union(authors[0], author)
+
+    def same_cluster(self, author1: NameType, author2: NameType) -> bool:
+        """Return True iff author1 and author2 are connected by a chain of
+        coauthors. An author is always in the same cluster as themselves.
+        """
+        if author1 == author2:
+            return True
+        if author1 not in self._parent or author2 not in self._parent:
+            return False
+        return self._find(author1) == self._find(author2)
+
+    def cluster_count(self) -> int:
+        """Return the number of clusters."""
+        return len(self._size)
+
+    def cluster_sizes(self) -> list[int]:
+        """Return the sizes of all clusters, largest first."""
+        return sorted(self._size.values(), reverse=True)
+
+    def cluster_of(self, author: NameType) -> list[NameType]:
+        """Return the authors in the cluster of author, sorted in
+        lexicographic order, or [] if author is unknown.
+        """
+        if author not in self._parent:
+            return []
+        root = self._find(author)
+        return sorted(other for other in self._parent
+                      if self._find(other) == root)
+
+    def largest_cluster(self) -> list[NameType]:
+        """Return the authors in the largest cluster, sorted in lexicographic
+        order, or [] if there are no authors. Ties are broken by the
+        smallest author name.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> AuthorClusters(EXAMPLE_ARXIV).largest_cluster()[:2]
+        [('Campbell', 'Jen'), ('Sharmin', 'Sadia')]
+        """
+        if not self._size:
+            return []
+        members = {}
+        for author in self._parent:
+            members.setdefault(self._find(author), []).append(author)
+        largest = min(members.values(), key=lambda group: (-len(group),
+                                                            min(group)))
+        return sorted(largest)
+
+    def _find(self, author: NameType) -> NameType:
+        """Return the root of the cluster of known author."""
+        parent = self._parent
+        while parent[author] != author:
+            parent[author] = parent[parent[author]]
+            author = parent[author]
+        return author
+
+    def _union(self, author1: NameType, author2: NameType) -> None:
+        """Merge the clusters of known authors author1 and author2."""
+        root1 = self._find(author1)
+        root2 = self._find(author2)
+        if root1 == root2:
+            return
+        if self._size[root1] < self._size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._size[root1] += self._size.pop(root2)
+
+
+################################################################################
+# Collaboration distance
+################################################################################
+# A collaboration path: (distance, authors along the chain from the first
+# author to the second, IDs of the articles linking consecutive authors).
+PathType = tuple[int, list[NameType], list[str]]
+
+# Maps each reached author to (previous author, linking article ID), or to
+# None for the author the search started from.
+_ParentsType = dict[NameType, Optional[tuple[NameType, str]]]
+
+
+class CoauthorGraph:
+    """An author adjacency built once from the articles, answering
+    collaboration-distance ("Erdos number") queries with bidirectional
+    breadth-first search.
+
+    _adjacent maps each author to a dict that maps each of their coauthors
+    to the smallest ID of an article they wrote together. Full BFS trees are
+    cached in _anchors for authors passed to add_anchor and for hub authors
+    (at least hub_degree coauthors) once they have been in hub_queries
+    queries, keeping at most cache_size trees, least recently used evicted
+    first. _hub_queries maps each hub author without a cached tree to the
+    number of queries they have been in.
+    """
+    hub_degree: int
+    hub_queries: int
+    cache_size: int
+    _adjacent: dict[NameType, dict[NameType, str]]
+    _anchors: dict[NameType, _ParentsType]
+    _hub_queries: dict[NameType, int]
+
+    def __init__(self, arxiv_data: Optional[ArxivType] = None,
+                 hub_degree: int = 50, cache_size: int = 16,
+                 hub_queries: int = 3) -> None:
+        """Initialize the graph of the authors in arxiv_data, if given."""
+        self.hub_degree = hub_degree
+        self.hub_queries = hub_queries
+        self.cache_size = cache_size
+        self._adjacent = {}
+        self._anchors = {}
+        self._hub_queries = {}
+        if arxiv_data is not None:
+            for article in arxiv_data.values():
+                self.add_article(article)
+
+    def add_article(self, article: ArticleType) -> None:
+        """Add the coauthor links of article to the graph."""
+        article_id = article[ID]
+        for author in article[AUTHORS]:
+            links = self._adjacent.setdefault(author, {})
+            for coauthor in article[AUTHORS]:
+                if coauthor != author and (coauthor not in links or
+                                           article_id < links[coauthor]):
+                    links[coauthor] = article_id
+        self._anchors.clear()
+        self._hub_queries.clear()
+
+    def coauthors(self, author: NameType) -> list[NameType]:
+        """Return the coauthors of author, sorted in lexicographic order, as
+        get_coauthors does.
+        """
+        return sorted(self._adjacent.get(author, {}))
+
+    def add_anchor(self, author: NameType) -> None:
+        """Precompute and cache the BFS tree of author so that later queries
+        involving author take time proportional to the path length.
+        """
+        if author in self._adjacent:
+            self._anchor_tree(author)
+
+    def distance(self, author1: NameType, author2: NameType) -> int:
+        """Return the number of coauthor hops between author1 and author2, or
+        -1 if they are not connected.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> graph = CoauthorGraph(EXAMPLE_ARXIV)
+        >>> graph.distance(('Sharmin', 'Sadia'), ('Yanez', 'Fernando'))
+        3
+        >>> graph.distance(('Sharmin', 'Sadia'), ('Grossman', 'Tovi'))
+        -1
+        """
+        path = self.path(author1, author2)
+        if path is None:
+            return -1
+        return path[0]
+
+    def path(self, author1: NameType, author2: NameType
+             ) -> Optional[PathType]:
+        """Return one shortest collaboration path from author1 to author2, or
+        None if they are not connected.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> graph = CoauthorGraph(EXAMPLE_ARXIV)
+        >>> distance, authors, ids = graph.path(('Sharmin', 'Sadia'),
+        ...                                     ('Campbell', 'Jen'))
+        >>> distance
+        2
+        >>> authors
+        [('Sharmin', 'Sadia'), ('Smith', 'Jacqueline E.'), ('Campbell', 'Jen')]
+        >>> ids
+        ['0001', '108']
+        """
+        if author1 not in self._adjacent or author2 not in self._adjacent:
+            return None
+        if author1 == author2:
+            return 0, [author1], []
+
+        use_tree2 = self._should_use_tree(author2)
+        use_tree1 = self._should_use_tree(author1)
+        if use_tree2:
+            return _tree_path(self._anchor_tree(author2), author1, True)
+        if use_tree1:
+            return _tree_path(self._anchor_tree(author1), author2, False)
+        return self._bidirectional_path(author1, author2)
+
+    def _should_use_tree(self, author: NameType) -> bool:
+        """Return True iff a query involving author should use the BFS tree
+        of author: it is cached, or author is a hub who has now been in
+        hub_queries queries. Count this query for author if they are a hub.
+        """
+        if author in self._anchors:
+            return True
+        if len(self._adjacent[author]) < self.hub_degree:
+            return False
+        queries = self._hub_queries.get(author, 0) + 1
+        self._hub_queries[author] = queries
+        return queries >= self.hub_queries
+
+    def _anchor_tree(self, author: NameType) -> _ParentsType:
+        """Return the BFS tree of author, computing and caching it if it is
+        not cached.
+        """
+        if author in self._anchors:
+            tree = self._anchors.pop(author)
+        else:
+            self._hub_queries.pop(author, None)
+            tree = {author: None}
+            frontier = [author]
+            while frontier:
+                frontier = self._expand(frontier, tree, {})[0]
+            while self._anchors and len(self._anchors) >= self.cache_size:
+                self._anchors.pop(next(iter(self._anchors)))
+        if self.cache_size > 0:
+            self._anchors[author] = tree
+        return tree
+
+    def _bidirectional_path(self, source: NameType, target: NameType
+                            ) -> Optional[PathType]:
+        """Return one shortest path from source to target, searching from
+        both ends and always expanding the smaller frontier.
+        """
+        source_parents = {source: None}
+        target_parents = {target: None}
+        source_frontier = [source]
+        target_frontier = [target]
+
+        while source_frontier and target_frontier:
+            if len(source_frontier) <= len(target_frontier):
+                source_frontier, meet = self._expand(
+                    source_frontier, source_parents, target_parents)
+            else:
+                target_frontier, meet = self._expand(
+                    target_frontier, target_parents, source_parents)
+            if meet is not None:
+                forward = _tree_path(source_parents, meet, False)
+                backward = _tree_path(target_parents, meet, True)
+                return (forward[0] + backward[0],
+                        forward[1] + backward[1][1:], forward[2] + backward[2])
+        return None
+
+    def _expand(self, frontier: list[NameType], parents: _ParentsType,
+                other_parents: _ParentsType
+                ) -> tuple[list[NameType], Optional[NameType]]:
+        """Record in parents every unreached coauthor of the authors in
+        frontier, and return (the next frontier, None). Stop early and return
+        ([], author) as soon as an author in other_parents is reached.
+        """
+        next_frontier = []
+        for author in frontier:
+            for coauthor, article_id in self._adjacent[author].items():
+                if coauthor not in parents:
+                    parents[coauthor] = (author, article_id)
+                    if coauthor in other_parents:
+                        return [], coauthor
+                    next_frontier.append(coauthor)
+        return next_frontier, None
+
+
+def _tree_path(parents: _ParentsType, author: NameType, toward_root: bool
+               ) -> Optional[PathType]:
+    """Return the path between author and the root of the BFS tree parents,
+    starting at author if toward_root, and at the root otherwise. Return
+    None if author is not in the tree.
+    """
+    if author not in parents:
+        return None
+    authors = [author]
+    ids = []
+    link = parents[author]
+    while link is not None:
+        authors.append(link[0])
+        ids.append(link[1])
+        link = parents[link[0]]
+    if not toward_root:
+        authors.reverse()
+        ids.reverse()
+    return len(ids), authors, ids
+
+
+################################################################################
+# Collaboration over time
+################################################################################
+class TemporalCoauthorGraph:
+    """An author graph where each coauthor link keeps the sorted list of
+    distinct years (from CREATED) of the articles behind it, so the graph
+    can be queried over any range of years without rescanning the articles.
+
+    _years maps each author to a dict that maps each of their coauthors to
+    that sorted list of years. Articles without a CREATED year add no links.
+    """
+    _years: dict[NameType, dict[NameType, list[int]]]
+
+    def __init__(self, arxiv_data: Optional[ArxivType] = None) -> None:
+        """Initialize the graph of the authors in arxiv_data, if given."""
+        self._years = {}
+        if arxiv_data is not None:
+            for article in arxiv_data.values():
+                self.add_article(article)
+
+    def add_article(self, article: ArticleType) -> None:
+        """Add the coauthor links of article, dated by its CREATED year."""
+        created = article[CREATED]
+        if not created[:4].isdigit():
+            return
+        year = int(created[:4])
+        for author in article[AUTHORS]:
+            links = self._years.setdefault(author, {})
+            for coauthor in article[AUTHORS]:
+                if coauthor != author:
+                    years = links.setdefault(coauthor, [])
+                    i = bisect.bisect_left(years, year)
+                    if i == len(years) or years[i] != year:
+                        years.insert(i, year)
+
+    def link_years(self, author1: NameType, author2: NameType) -> list[int]:
+        """Return the sorted years in which author1 and author2 wrote an
+        article together.
+        """
+        return list(self._years.get(author1, {}).get(author2, []))
+
+    def coauthors_between(self, author: NameType, first_year: int,
+                          last_year: int) -> list[NameType]:
+        """Return the coauthors of author on articles created from first_year
+        to last_year inclusive, sorted in lexicographic order.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> graph = TemporalCoauthorGraph(EXAMPLE_ARXIV)
+        >>> graph.coauthors_between(('Smith', 'Jacqueline E.'), 2023, 2023)[:2]
+        [('Campbell', 'Jen'), ('Sharmin', 'Sadia')]
+        >>> graph.coauthors_between(('Smith', 'Jacqueline E.'), 2020, 2022)
+        []
+        """
+        return self.window(first_year, last_year).coauthors(author)
+
+    def window(self, first_year: Optional[int],
+               last_year: Optional[int]) -> 'CoauthorSnapshot':
+        """Return a view of the graph restricted to links from first_year to
+        last_year inclusive. None leaves that end of the range open.
+        """
+        return CoauthorSnapshot(self._years, first_year, last_year)
+
+    def as_of(self, year: int) -> 'CoauthorSnapshot':
+        """Return a view of the graph as it stood at the end of year."""
+        return self.window(None, year)
+
+
+class CoauthorSnapshot:
+    """A read-only view of a TemporalCoauthorGraph over a range of years. It
+    shares the graph's data rather than copying it.
+    """
+    first_year: Optional[int]
+    last_year: Optional[int]
+    _years: dict[NameType, dict[NameType, list[int]]]
+
+    def __init__(self, years: dict[NameType, dict[NameType, list[int]]],
+                 first_year: Optional[int],
+                 last_year: Optional[int]) -> None:
+        """Initialize a view of years restricted to first_year..last_year."""
+        self._years = years
+        self.first_year = first_year
+        self.last_year = last_year
+
+    def coauthors(self, author: NameType) -> list[NameType]:
+        """Return the coauthors of author in this view, sorted in
+        lexicographic order.
+        """
+        return sorted(coauthor
+                      for coauthor, years in self._years.get(author, {}).items()
+                      if self._in_range(years))
+
+    def authors(self) -> list[NameType]:
+        """Return the authors with at least one coauthor in this view, sorted
+        in lexicographic order.
+        """
+        return sorted(author for author, links in self._years.items()
+                      if any(self._in_range(years)
+                             for years in links.values()))
+
+    def edges(self) -> Iterator[tuple[NameType, NameType]]:
+        """Yield each coauthor link in this view once, as (author1, author2)
+        with author1 < author2.
+        """
+        for author, links in self._years.items():
+            for coauthor, years in links.items():
+                if author < coauthor and self._in_range(years):
+                    yield author, coauthor
+
+    def _in_range(self, years: list[int]) -> bool:
+        """Return True iff some year in the sorted list years lies in this
+        view's range.
+        """
+        if self.first_year is None:
+            i = 0
+        else:
+            i = bisect.bisect_left(years, self.first_year)
+        return i < len(years) and (self.last_year is None or
+                                   years[i] <= self.last_year)
@@ -0,0 +1,36 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Shared pytest fixtures for the data files next to this module.
+
+Paths are resolved from this file rather than the working directory, so the
+tests pass wherever pytest is run from.
+"""
+
+import os
+import pytest
+import arxiv_functions
+from constants import ID, ArxivType
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope='session')
+def data_path() -> str:
+    """Return the path of data.txt."""
+    return os.path.join(_HERE, 'data.txt')
+
+
+@pytest.fixture(scope='session')
+def example_data_path() -> str:
+    """Return the path of example_data.txt."""
+    return os.path.join(_HERE, 'example_data.txt')
+
+
+@pytest.fixture(scope='session')
+def arxiv_data(data_path: str) -> ArxivType:
+    """Return the ArxivType for data.txt, read once per test session. Tests
+    must not modify it.
+    """
+    with open(data_path) as f:
+        return {article[ID]: article
+                for article in arxiv_functions.read_arxiv_records(f)}
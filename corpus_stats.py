@@ -0,0 +1,178 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+One-pass, mergeable corpus statistics for arxiv metadata.
+
+Every aggregate is kept as a count or a histogram, so two CorpusStats built
+over different shards of a corpus can be merged into exactly the statistics
+of the combined corpus.
+"""
+
+import math
+from datetime import date
+from typing import Iterable, Union
+
+from constants import (CREATED, MODIFIED, AUTHORS, ABSTRACT,
+                       NameType, ArticleType, ArxivType)
+
+
+class CorpusStats:
+    """Aggregate statistics over a collection of articles.
+
+    author_count_hist maps a number of authors to the number of articles
+    with that many authors. articles_per_year maps a CREATED year to the
+    number of articles created in that year. lag_days_hist maps the number
+    of days between CREATED and MODIFIED to a number of articles (articles
+    missing either date are not counted). abstract_length_hist maps an
+    abstract length, in words, to a number of articles. authors is the set
+    of distinct authors seen.
+    """
+    article_count: int
+    author_count_hist: dict[int, int]
+    articles_per_year: dict[int, int]
+    lag_days_hist: dict[int, int]
+    abstract_length_hist: dict[int, int]
+    authors: set[NameType]
+
+    def __init__(self) -> None:
+        """Initialize statistics for an empty corpus."""
+        self.article_count = 0
+        self.author_count_hist = {}
+        self.articles_per_year = {}
+        self.lag_days_hist = {}
+        self.abstract_length_hist = {}
+        self.authors = set()
+
+    def add(self, article: ArticleType) -> None:
+        """Include article in these statistics."""
+        self.article_count += 1
+        _increment(self.author_count_hist, len(article[AUTHORS]))
+        self.authors.update(article[AUTHORS])
+        _increment(self.abstract_length_hist,
+                   len(article[ABSTRACT].split()))
+
+        created = _parse_date(article[CREATED])
+        if created is not None:
+            _increment(self.articles_per_year, created.year)
+            modified = _parse_date(article[MODIFIED])
+            if modified is not None:
+                _increment(self.lag_days_hist, (modified - created).days)
+
+    def merge(self, other: 'CorpusStats') -> None:
+        """Fold the statistics in other into these statistics."""
+        self.article_count += other.article_count
+        for mine, theirs in [(self.author_count_hist, other.author_count_hist),
+                             (self.articles_per_year, other.articles_per_year),
+                             (self.lag_days_hist, other.lag_days_hist),
+                             (self.abstract_length_hist,
+                              other.abstract_length_hist)]:
+            for key, count in theirs.items():
+                _increment(mine, key, count)
+        self.authors.update(other.authors)
+
+    def mean_author_count(self) -> float:
+        """Return the average number of authors per article, or 0.0 if there
+        are no articles.
+        """
+        if self.article_count == 0:
+            return 0.0
+        total = 0
+        for author_count, articles in self.author_count_hist.items():
+            total += author_count * articles
+        return total / self.article_count
+
+    def median_author_count(self) -> float:
+        """Return the median number of authors per article, or 0.0 if there
+        are no articles.
+        """
+        if self.article_count == 0:
+            return 0.0
+        middle = (self.article_count - 1) // 2
+        low = _nth_smallest(self.author_count_hist, middle)
+        if self.article_count % 2 == 1:
+            return float(low)
+        return (low + _nth_smallest(self.author_count_hist, middle + 1)) / 2
+
+    def abstract_length_percentile(self, percent: float) -> int:
+        """Return the nearest-rank percent-th percentile of abstract lengths,
+        in words, or 0 if there are no articles.
+
+        Precondition: 0 <= percent <= 100
+        """
+        if self.article_count == 0:
+            return 0
+        rank = max(1, math.ceil(percent * self.article_count / 100))
+        return _nth_smallest(self.abstract_length_hist, rank - 1)
+
+    def distinct_author_count(self) -> int:
+        """Return the number of distinct authors."""
+        return len(self.authors)
+
+
+def corpus_stats(articles: Union[ArxivType, Iterable[ArticleType]]
+                 ) -> CorpusStats:
+    """Return the statistics of articles, which is either an ArxivType or an
+    iterable of articles such as read_arxiv_records(f), computed in a single
+    pass.
+
+    >>> from arxiv_functions import EXAMPLE_ARXIV
+    >>> stats = corpus_stats(EXAMPLE_ARXIV)
+    >>> stats.mean_author_count()
+    1.6
+    >>> stats.median_author_count()
+    2.0
+    >>> stats.articles_per_year
+    {2023: 4}
+    >>> stats.distinct_author_count()
+    6
+    """
+    if isinstance(articles, dict):
+        articles = articles.values()
+    stats = CorpusStats()
+    for article in articles:
+        stats.add(article)
+    return stats
+
+
+def _increment(counts: dict[int, int], key: int, amount: int = 1) -> None:
+    """Add amount to the count for key in counts.
+
+    >>> counts = {3: 1}
+    >>> _increment(counts, 3)
+    >>> _increment(counts, 5, 2)
+    >>> counts
+    {3: 2, 5: 2}
+    """
+    counts[key] = counts.get(key, 0) + amount
+
+
+def _nth_smallest(hist: dict[int, int], n: int) -> int:
+    """Return the value at 0-based position n of the sorted values described
+    by the histogram hist.
+
+    Precondition: 0 <= n < sum(hist.values())
+
+    >>> _nth_smallest({1: 2, 4: 1}, 1)
+    1
+    >>> _nth_smallest({1: 2, 4: 1}, 2)
+    4
+    """
+    for value in sorted(hist):
+        if n < hist[value]:
+            return value
+        n -= hist[value]
+    raise IndexError(n)
+
+
+def _parse_date(text: str) -> Union[date, None]:
+    """Return the date in the YYYY-MM-DD string text, or None if text is
+    not a valid date.
+
+    >>> _parse_date('2023-08-20')
+    datetime.date(2023, 8, 20)
+    >>> _parse_date('') is None
+    True
+    """
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return None
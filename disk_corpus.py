@@ -0,0 +1,243 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Ingest of arxiv metadata files that do not fit in memory.
+
+Records are parsed one at a time and buffered until the buffer reaches a
+memory budget. A full buffer is spilled to disk as two sorted runs: one of
+articles by ID and one of author -> article IDs postings by author. Once the
+whole file has been read, the runs are k-way merged into two dbm stores,
+which DiskCorpus reads back.
+"""
+
+import dbm
+import heapq
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from typing import Iterator, TextIO
+
+from arxiv_functions import read_arxiv_records
+from constants import ID, AUTHORS, NameType, ArticleType
+
+ARTICLES_DB = 'articles'
+AUTHORS_DB = 'authors'
+
+# Rough per-entry bookkeeping cost, in bytes, of a buffered article or
+# posting on top of its serialized size.
+_ENTRY_OVERHEAD = 100
+
+
+################################################################################
+# Reading a stored corpus
+################################################################################
+class DiskCorpus(Mapping):
+    """A read-only ArxivType backed by the dbm stores written by ingest.
+
+    It can be passed to the functions in arxiv_functions that only read
+    their ArxivType argument; each article is loaded from disk when it is
+    looked up. author_articles reads one author's postings without building
+    the whole make_author_to_articles dict.
+    """
+    _articles: object
+    _authors: object
+
+    def __init__(self, directory: str) -> None:
+        """Open the corpus stored in directory by ingest."""
+        self._articles = dbm.open(os.path.join(directory, ARTICLES_DB), 'r')
+        self._authors = dbm.open(os.path.join(directory, AUTHORS_DB), 'r')
+
+    def __getitem__(self, article_id: str) -> ArticleType:
+        """Return the article with ID article_id."""
+        return _decode_article(self._articles[article_id.encode()])
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the article IDs in the corpus."""
+        for key in self._articles.keys():
+            yield key.decode()
+
+    def __len__(self) -> int:
+        """Return the number of articles in the corpus."""
+        return len(self._articles)
+
+    def __contains__(self, article_id: object) -> bool:
+        """Return True iff article_id is the ID of an article in the corpus.
+        """
+        return isinstance(article_id, str) and \
+            article_id.encode() in self._articles
+
+    def author_articles(self, author: NameType) -> list[str]:
+        """Return the sorted IDs of the articles written by author, as
+        make_author_to_articles would, or [] for an unknown author.
+        """
+        key = _author_key(author).encode()
+        if key not in self._authors:
+            return []
+        return json.loads(self._authors[key])
+
+    def authors(self) -> Iterator[NameType]:
+        """Yield every author in the corpus."""
+        for key in self._authors.keys():
+            yield tuple(json.loads(key))
+
+    def close(self) -> None:
+        """Close the underlying stores."""
+        self._articles.close()
+        self._authors.close()
+
+    def __enter__(self) -> 'DiskCorpus':
+        """Return this corpus, to be closed at the end of a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close this corpus."""
+        self.close()
+
+
+################################################################################
+# Building a stored corpus
+################################################################################
+def ingest(f: TextIO, directory: str, memory_budget: int) -> int:
+    """Read the arxiv metadata in f into dbm stores in directory, buffering
+    at most about memory_budget bytes of parsed data at a time, and return
+    the number of sorted runs spilled to disk.
+
+    As with read_arxiv_file, a later article replaces an earlier one with
+    the same ID in the article store; the author store assumes IDs are
+    unique, as they are in arxiv data. Open the result with
+    DiskCorpus(directory).
+    """
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=directory) as run_dir:
+        article_runs = []
+        posting_runs = []
+        buffer = _SpillBuffer()
+        for sequence, article in enumerate(read_arxiv_records(f)):
+            buffer.add(sequence, article)
+            if buffer.size > memory_budget:
+                buffer.spill(run_dir, article_runs, posting_runs)
+        if buffer.size > 0 or not article_runs:
+            buffer.spill(run_dir, article_runs, posting_runs)
+
+        _merge_articles(article_runs, os.path.join(directory, ARTICLES_DB))
+        _merge_postings(posting_runs, os.path.join(directory, AUTHORS_DB))
+        return len(article_runs)
+
+
+class _SpillBuffer:
+    """Parsed articles and author postings waiting to be spilled.
+
+    articles maps each article ID to (sequence number, serialized article).
+    postings maps each author key to a list of (sequence number, article ID)
+    pairs. size is the estimated number of bytes buffered.
+    """
+    articles: dict[str, tuple[int, str]]
+    postings: dict[str, list[tuple[int, str]]]
+    size: int
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.articles = {}
+        self.postings = {}
+        self.size = 0
+
+    def add(self, sequence: int, article: ArticleType) -> None:
+        """Buffer article, the sequence-th article of the input."""
+        encoded = json.dumps(article)
+        self.articles[article[ID]] = (sequence, encoded)
+        self.size += len(encoded) + _ENTRY_OVERHEAD
+        for author in article[AUTHORS]:
+            self.postings.setdefault(_author_key(author), []).append(
+                (sequence, article[ID]))
+            self.size += len(article[ID]) + _ENTRY_OVERHEAD
+
+    def spill(self, run_dir: str, article_runs: list[str],
+              posting_runs: list[str]) -> None:
+        """Write the buffer as one sorted article run and one sorted posting
+        run in run_dir, record their paths, and empty the buffer.
+        """
+        article_runs.append(_write_run(
+            run_dir, ([article_id, sequence, encoded]
+                      for article_id, (sequence, encoded)
+                      in sorted(self.articles.items()))))
+        posting_runs.append(_write_run(
+            run_dir, ([key, sequence, article_id]
+                      for key in sorted(self.postings)
+                      for sequence, article_id in self.postings[key])))
+        self.articles = {}
+        self.postings = {}
+        self.size = 0
+
+
+def _write_run(run_dir: str, entries: Iterator[list]) -> str:
+    """Write entries to a new run file in run_dir, one JSON list per line,
+    and return its path.
+    """
+    fd, path = tempfile.mkstemp(dir=run_dir, suffix='.run')
+    with os.fdopen(fd, 'w', encoding='utf-8') as run:
+        for entry in entries:
+            run.write(json.dumps(entry) + '\n')
+    return path
+
+
+def _read_run(path: str) -> Iterator[list]:
+    """Yield the entries of the run file at path."""
+    with open(path, encoding='utf-8') as run:
+        for line in run:
+            yield json.loads(line)
+
+
+def _merge_articles(runs: list[str], db_path: str) -> None:
+    """Merge the sorted article runs into a new dbm store at db_path. Of
+    several articles with the same ID, the one read last is kept.
+    """
+    with dbm.open(db_path, 'n') as db:
+        current = None
+        for article_id, _, encoded in heapq.merge(
+                *[_read_run(path) for path in runs],
+                key=lambda entry: (entry[0], entry[1])):
+            if current is not None and current[0] != article_id:
+                db[current[0].encode()] = current[1].encode()
+            current = (article_id, encoded)
+        if current is not None:
+            db[current[0].encode()] = current[1].encode()
+
+
+def _merge_postings(runs: list[str], db_path: str) -> None:
+    """Merge the sorted posting runs into a new dbm store at db_path that
+    maps each author key to the JSON list of their sorted article IDs.
+    """
+    with dbm.open(db_path, 'n') as db:
+        current_key = None
+        ids = []
+        for key, _, article_id in heapq.merge(
+                *[_read_run(path) for path in runs],
+                key=lambda entry: (entry[0], entry[1])):
+            if key != current_key:
+                if current_key is not None:
+                    db[current_key.encode()] = json.dumps(sorted(ids))
+                current_key = key
+                ids = []
+            ids.append(article_id)
+        if current_key is not None:
+            db[current_key.encode()] = json.dumps(sorted(ids))
+
+
+def _author_key(author: NameType) -> str:
+    """Return the store key for author.
+
+    >>> _author_key(('Smith', 'Jacqueline E.'))
+    '["Smith", "Jacqueline E."]'
+    """
+    return json.dumps(list(author))
+
+
+def _decode_article(encoded: bytes) -> ArticleType:
+    """Return the article serialized in encoded.
+
+    >>> _decode_article(b'{"authors": [["Smith", "Jen"]]}')
+    {'authors': [('Smith', 'Jen')]}
+    """
+    article = json.loads(encoded)
+    article[AUTHORS] = [tuple(author) for author in article[AUTHORS]]
+    return article
@@ -0,0 +1,206 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Parallel map-reduce jobs that run directly over an arxiv metadata file.
+
+The file is split into byte ranges that start and end on END boundaries.
+Each worker process streams the records in its range, maps every record,
+and folds the mapped values together with the job's reducer; the parent
+only ever sees one partial result per range.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from arxiv_functions import read_arxiv_records
+from constants import ID, AUTHORS, END, NameType, ArticleType
+
+Mapper = Callable[[ArticleType], Any]
+Reducer = Callable[[Any, Any], Any]
+
+
+################################################################################
+# The map-reduce runner
+################################################################################
+def run_job(path: str, mapper: Mapper, reducer: Reducer, initial: Any,
+            workers: Optional[int] = None) -> Any:
+    """Return the result of mapping every article in the arxiv metadata file
+    at path with mapper and folding the results, starting from initial, with
+    reducer.
+
+    reducer(accumulated, value) returns the new accumulated value. It must be
+    associative, accept partial results as either argument, and may modify
+    and return its first argument. mapper and reducer must be module-level
+    functions so they can be sent to worker processes. If workers is None,
+    one worker per CPU is used; with one worker, the job runs in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    ranges = split_file(path, workers)
+
+    if workers == 1 or len(ranges) == 1:
+        return _fold((_run_range(path, start, end, mapper, reducer)
+                      for start, end in ranges), reducer, initial)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _fold(pool.map(_run_range, [path] * len(ranges),
+                              [start for start, _ in ranges],
+                              [end for _, end in ranges],
+                              [mapper] * len(ranges),
+                              [reducer] * len(ranges)), reducer, initial)
+
+
+def _fold(partials: Iterable[tuple[bool, Any]], reducer: Reducer,
+          initial: Any) -> Any:
+    """Return initial folded with reducer over the partial results in
+    partials, a stream of (has_records, partial) pairs from _run_range.
+    Each partial is folded in as it arrives, so they are never all held at
+    once.
+    """
+    result = initial
+    for has_records, partial in partials:
+        if has_records:
+            result = reducer(result, partial)
+    return result
+
+
+def split_file(path: str, pieces: int) -> list[tuple[int, int]]:
+    """Return a list of at most pieces (start, end) byte ranges that together
+    cover the file at path, where every range ends just after an END line.
+
+    Precondition: pieces >= 1
+    """
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, pieces):
+            target = size * i // pieces
+            if target <= boundaries[-1]:
+                continue
+            f.seek(target)
+            f.readline()  # finish the (possibly partial) current line
+            line = f.readline()
+            while line and line.strip() != END.encode():
+                line = f.readline()
+            if f.tell() < size and f.tell() > boundaries[-1]:
+                boundaries.append(f.tell())
+    boundaries.append(size)
+    return [(boundaries[i], boundaries[i + 1])
+            for i in range(len(boundaries) - 1)]
+
+
+def _run_range(path: str, start: int, end: int, mapper: Mapper,
+               reducer: Reducer) -> tuple[bool, Any]:
+    """Return (has_records, partial) for the records of the file at path that
+    lie in the byte range [start, end), where partial is the reduction of
+    their mapped values. has_records is False if the range holds no records.
+    """
+    has_records = False
+    partial = None
+    with open(path, 'rb') as f:
+        f.seek(start)
+        for article in read_arxiv_records(_lines_in_range(f, end)):
+            value = mapper(article)
+            if has_records:
+                partial = reducer(partial, value)
+            else:
+                partial = value
+                has_records = True
+    return has_records, partial
+
+
+def _lines_in_range(f: Any, end: int) -> Iterator[str]:
+    """Yield the decoded lines of binary file f from its current position up
+    to byte offset end.
+    """
+    while f.tell() < end:
+        line = f.readline()
+        if not line:
+            return
+        yield line.decode('utf-8')
+
+
+################################################################################
+# Built-in jobs
+################################################################################
+def author_to_articles(path: str, workers: Optional[int] = None
+                       ) -> dict[NameType, list[str]]:
+    """Return the same author to sorted article IDs dict as
+    make_author_to_articles, for the articles in the file at path.
+    """
+    result = run_job(path, _map_author_to_articles, _reduce_dict_of_lists, {},
+                     workers)
+    for articles in result.values():
+        articles.sort()
+    return result
+
+
+def author_counts(path: str, workers: Optional[int] = None
+                  ) -> dict[NameType, int]:
+    """Return a dict that maps each author in the file at path to the number
+    of articles they wrote.
+    """
+    return run_job(path, _map_author_counts, _reduce_counts, {}, workers)
+
+
+def average_author_count(path: str, workers: Optional[int] = None) -> float:
+    """Return the average number of authors per article in the file at path,
+    as average_author_count does for an ArxivType.
+    """
+    authors, articles = run_job(path, _map_author_count, _reduce_pairs,
+                                (0, 0), workers)
+    if articles == 0:
+        return 0.0
+    return authors / articles
+
+
+def _map_author_to_articles(article: ArticleType
+                            ) -> dict[NameType, list[str]]:
+    """Return a dict mapping each author of article to a list of its ID."""
+    result = {}
+    for author in article[AUTHORS]:
+        result.setdefault(author, []).append(article[ID])
+    return result
+
+
+def _reduce_dict_of_lists(acc: dict[Any, list], value: dict[Any, list]
+                          ) -> dict[Any, list]:
+    """Extend the lists in acc with the lists in value and return acc.
+
+    >>> _reduce_dict_of_lists({'a': [1]}, {'a': [2], 'b': [3]})
+    {'a': [1, 2], 'b': [3]}
+    """
+    for key, items in value.items():
+        acc.setdefault(key, []).extend(items)
+    return acc
+
+
+def _map_author_counts(article: ArticleType) -> dict[NameType, int]:
+    """Return a dict mapping each distinct author of article to 1."""
+    return dict.fromkeys(article[AUTHORS], 1)
+
+
+def _reduce_counts(acc: dict[Any, int], value: dict[Any, int]
+                   ) -> dict[Any, int]:
+    """Add the counts in value to acc and return acc.
+
+    >>> _reduce_counts({'a': 1}, {'a': 2, 'b': 1})
+    {'a': 3, 'b': 1}
+    """
+    for key, count in value.items():
+        acc[key] = acc.get(key, 0) + count
+    return acc
+
+
+def _map_author_count(article: ArticleType) -> tuple[int, int]:
+    """Return (number of authors of article, 1)."""
+    return len(article[AUTHORS]), 1
+
+
+def _reduce_pairs(acc: tuple[int, int], value: tuple[int, int]
+                  ) -> tuple[int, int]:
+    """Return the element-wise sum of acc and value.
+
+    >>> _reduce_pairs((1, 2), (3, 4))
+    (4, 6)
+    """
+    return acc[0] + value[0], acc[1] + value[1]
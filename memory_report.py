@@ -0,0 +1,191 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Memory footprint accounting for a loaded ArxivType and the structures
+derived from it, for capacity planning.
+"""
+
+import sys
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from constants import ArxivType
+
+
+class MemoryReport:
+    """The memory used by an ArxivType and its derived structures.
+
+    The estimated sizes are deep sizes from sys.getsizeof, counting each
+    object once. strings, author_tuples and containers break down the
+    estimated size of the ArxivType: all str objects, the NameType tuples,
+    and the dicts and lists holding them. measured is the number of bytes
+    tracemalloc saw held by the ArxivType when it was built with measure, or
+    None if it was not built that way. derived maps the name of each derived
+    structure to its (estimated, measured) size, not counting objects it
+    shares with the ArxivType; its measured size is None likewise.
+    """
+    article_count: int
+    strings: int
+    author_tuples: int
+    containers: int
+    measured: Optional[int]
+    derived: dict[str, tuple[int, Optional[int]]]
+
+    def __init__(self, article_count: int) -> None:
+        """Initialize an empty report for article_count articles."""
+        self.article_count = article_count
+        self.strings = 0
+        self.author_tuples = 0
+        self.containers = 0
+        self.measured = None
+        self.derived = {}
+
+    def estimated(self) -> int:
+        """Return the estimated size of the ArxivType."""
+        return self.strings + self.author_tuples + self.containers
+
+    def per_article(self) -> float:
+        """Return the estimated size of the ArxivType per article, or 0.0 if
+        there are no articles.
+        """
+        if self.article_count == 0:
+            return 0.0
+        return self.estimated() / self.article_count
+
+    def total(self) -> int:
+        """Return the estimated size of the ArxivType and all derived
+        structures.
+        """
+        return self.estimated() + sum(size for size, _ in
+                                      self.derived.values())
+
+    def projected(self, factor: float) -> int:
+        """Return the projected total size at factor times the current
+        number of articles, assuming every structure grows linearly with
+        the number of articles.
+        """
+        return round(self.total() * factor)
+
+    def __str__(self) -> str:
+        """Return a table of this report, with n/a for sizes that were not
+        measured.
+        """
+        rows = [('articles', self.article_count),
+                ('per article', round(self.per_article())),
+                ('strings', self.strings),
+                ('author tuples', self.author_tuples),
+                ('containers', self.containers),
+                ('arxiv estimated', self.estimated()),
+                ('arxiv measured', self.measured)]
+        for name, (estimated, measured) in self.derived.items():
+            rows.append((name + ' estimated', estimated))
+            rows.append((name + ' measured', measured))
+        rows.append(('total estimated', self.total()))
+        return '\n'.join('{:<30}{:>15}'.format(label, _format_size(value))
+                         for label, value in rows)
+
+
+def memory_report(data: ArxivType,
+                  derived: Optional[dict[str, Any]] = None,
+                  measured: Optional[dict[str, int]] = None) -> MemoryReport:
+    """Return a MemoryReport for data and the structures in derived, which
+    maps a name to a structure built from data such as the result of
+    make_author_to_articles.
+
+    Measured sizes exist only for structures built with measure: measured
+    maps 'arxiv' and names in derived to the sizes measure reported while
+    building data and those structures, and every other measured size is
+    reported as None.
+
+    >>> from arxiv_functions import EXAMPLE_ARXIV, make_author_to_articles
+    >>> by_author, size = measure(lambda: make_author_to_articles(
+    ...     EXAMPLE_ARXIV))
+    >>> report = memory_report(EXAMPLE_ARXIV, {'by author': by_author},
+    ...                        {'by author': size})
+    >>> report.article_count
+    5
+    >>> report.estimated() > 0 and report.derived['by author'][1] > 0
+    True
+    >>> report.measured is None
+    True
+    >>> report.projected(10) == 10 * report.total()
+    True
+    """
+    if measured is None:
+        measured = {}
+    report = MemoryReport(len(data))
+    seen = set()
+    sizes = {str: 0, tuple: 0}
+    report.containers = _deep_size(data, seen, sizes)
+    report.strings = sizes[str]
+    report.author_tuples = sizes[tuple]
+    report.containers -= report.strings + report.author_tuples
+    report.measured = measured.get('arxiv')
+
+    if derived is not None:
+        for name, structure in derived.items():
+            report.derived[name] = (_deep_size(structure, seen, {}),
+                                    measured.get(name))
+    return report
+
+
+def measure(builder: Callable[[], Any]) -> tuple[Any, int]:
+    """Return (the result of calling builder, the number of bytes that
+    tracemalloc saw allocated while builder ran and still held when it
+    returned). Objects the result shares with existing objects are not
+    counted, and no copy of the result is made.
+
+    >>> words, size = measure(lambda: ['cats'] * 1000)
+    >>> len(words), size >= 8 * len(words)
+    (1000, True)
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = builder()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, size
+
+
+def _format_size(size: Optional[int]) -> str:
+    """Return size with thousands separators, or 'n/a' if it is None.
+
+    >>> _format_size(1234567), _format_size(None)
+    ('1,234,567', 'n/a')
+    """
+    if size is None:
+        return 'n/a'
+    return '{:,}'.format(size)
+
+
+def _deep_size(obj: Any, seen: set[int], sizes: dict[type, int]) -> int:
+    """Return the size in bytes of obj and everything it refers to through
+    dicts, lists, tuples and sets, skipping objects whose id is in seen and
+    adding the ids of the objects counted to seen. For each type in sizes,
+    also add the size of the counted objects of that type to sizes.
+
+    >>> _deep_size([], set(), {}) == sys.getsizeof([])
+    True
+    """
+    total = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        total += size
+        if type(obj) in sizes:
+            sizes[type(obj)] += size
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return total
+
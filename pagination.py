@@ -0,0 +1,143 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Cursor-based pages of keyword and author query results.
+
+Results come from sorted posting lists, read lazily from the position a
+cursor points at, so a page costs about its own size rather than the size
+of the whole result.
+"""
+
+import base64
+import binascii
+import bisect
+import heapq
+from typing import Iterator, Optional
+
+from arxiv_functions import clean_word, article_words
+from constants import AUTHORS, NameType, ArxivType
+
+# A page of results: (article IDs, cursor for the next page or None if this
+# is the last page).
+PageType = tuple[list[str], Optional[str]]
+
+
+class PostingIndex:
+    """Sorted posting lists of article IDs by keyword and by author.
+
+    _by_word maps each cleaned word (as in contains_keyword) to the sorted
+    IDs of the articles containing it. _by_author maps each author to the
+    sorted IDs of their articles, as make_author_to_articles does.
+    """
+    _by_word: dict[str, list[str]]
+    _by_author: dict[NameType, list[str]]
+
+    def __init__(self, arxiv_data: ArxivType) -> None:
+        """Initialize the posting lists of the articles in arxiv_data."""
+        self._by_word = {}
+        self._by_author = {}
+        for article_id in sorted(arxiv_data):
+            article = arxiv_data[article_id]
+            for word in article_words(article):
+                self._by_word.setdefault(word, []).append(article_id)
+            for author in article[AUTHORS]:
+                self._by_author.setdefault(author, []).append(article_id)
+
+    def iter_keywords(self, keywords: list[str],
+                      after: Optional[str] = None) -> Iterator[str]:
+        """Yield, in sorted order and without repeats, the IDs of articles
+        containing any of keywords, starting after the ID after if given.
+        """
+        postings = []
+        for keyword in keywords:
+            word = clean_word(keyword)
+            if word in self._by_word:
+                postings.append(_iter_after(self._by_word[word], after))
+        return _unique(heapq.merge(*postings))
+
+    def iter_author(self, author: NameType,
+                    after: Optional[str] = None) -> Iterator[str]:
+        """Yield, in sorted order, the IDs of the articles written by author,
+        starting after the ID after if given.
+        """
+        return _iter_after(self._by_author.get(author, []), after)
+
+    def keyword_page(self, keywords: list[str], page_size: int,
+                     cursor: Optional[str] = None) -> PageType:
+        """Return the page of page_size IDs of articles containing any of
+        keywords that starts at cursor, or at the first result if cursor is
+        None. Pass the returned cursor to get the next page.
+
+        Precondition: page_size >= 1
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> index = PostingIndex(EXAMPLE_ARXIV)
+        >>> ids, cursor = index.keyword_page(['we', 'no'], 2)
+        >>> ids
+        ['0001', '03221']
+        >>> index.keyword_page(['we', 'no'], 2, cursor)
+        (['108', '42'], None)
+        """
+        after = decode_cursor(cursor)
+        return _page(self.iter_keywords(keywords, after), page_size)
+
+    def author_page(self, author: NameType, page_size: int,
+                    cursor: Optional[str] = None) -> PageType:
+        """Return the page of page_size IDs of articles written by author
+        that starts at cursor, or at the first result if cursor is None.
+        Pass the returned cursor to get the next page.
+
+        Precondition: page_size >= 1
+        """
+        after = decode_cursor(cursor)
+        return _page(self.iter_author(author, after), page_size)
+
+
+def encode_cursor(last_id: str) -> str:
+    """Return an opaque cursor for the page that follows the ID last_id.
+
+    >>> decode_cursor(encode_cursor('0704.0002'))
+    '0704.0002'
+    """
+    return base64.urlsafe_b64encode(last_id.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[str]:
+    """Return the last ID of the previous page encoded in cursor, or None if
+    cursor is None. Raise ValueError if cursor is not a valid cursor.
+    """
+    if cursor is None:
+        return None
+    try:
+        return base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    except (binascii.Error, UnicodeError) as error:
+        raise ValueError('invalid cursor: {!r}'.format(cursor)) from error
+
+
+def _iter_after(ids: list[str], after: Optional[str]) -> Iterator[str]:
+    """Yield the IDs in the sorted list ids that come after after, or all of
+    them if after is None.
+    """
+    start = 0 if after is None else bisect.bisect_right(ids, after)
+    for i in range(start, len(ids)):
+        yield ids[i]
+
+
+def _unique(ids: Iterator[str]) -> Iterator[str]:
+    """Yield the IDs of the sorted iterator ids, skipping repeats."""
+    previous = None
+    for article_id in ids:
+        if article_id != previous:
+            yield article_id
+            previous = article_id
+
+
+def _page(ids: Iterator[str], page_size: int) -> PageType:
+    """Return the first page_size IDs of ids and the cursor of the page after
+    them, or None if ids has no more IDs.
+    """
+    page = []
+    for article_id in ids:
+        if len(page) == page_size:
+            return page, encode_cursor(page[-1])
+        page.append(article_id)
+    return page, None
@@ -0,0 +1,230 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+A corpus partitioned across local worker processes by article ID hash.
+
+Each worker holds one shard of the articles for its whole life. A query is
+sent to every worker at once (scatter), each worker answers it over its own
+shard with the single-process function from arxiv_functions, and the
+coordinator merges the partial results (gather) into exactly what that
+function returns for the whole corpus.
+"""
+
+import heapq
+import multiprocessing
+import zlib
+from typing import Any, Iterable
+
+import arxiv_functions
+from constants import ID, AUTHORS, NameType, ArticleType, ArxivType
+
+# How many articles from_articles sends to a worker at a time, and how many
+# batches it lets a worker fall behind by before waiting for it.
+_BATCH_SIZE = 500
+_MAX_PENDING = 8
+
+# How many seconds close waits for a worker to stop before terminating it.
+_STOP_TIMEOUT = 5
+
+
+class ShardedArxiv:
+    """An ArxivType split across worker processes.
+
+    _connections holds one pipe end per worker, and _processes the worker
+    processes, in shard order.
+    """
+    _connections: list[Any]
+    _processes: list[multiprocessing.Process]
+
+    def __init__(self, workers: int) -> None:
+        """Start workers worker processes, each with an empty shard.
+
+        Precondition: workers >= 1
+        """
+        self._connections = []
+        self._processes = []
+        for _ in range(workers):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_serve,
+                                              args=(child_end,), daemon=True)
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[ArticleType],
+                      workers: int) -> 'ShardedArxiv':
+        """Return a ShardedArxiv of workers workers holding articles, which
+        is an iterable such as read_arxiv_records(f) or the values of an
+        ArxivType. Articles are sent in batches, so the coordinator never
+        holds the whole corpus.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> with ShardedArxiv.from_articles(EXAMPLE_ARXIV.values(), 2) as data:
+        ...     data.get_coauthors(('Smith', 'Jacqueline E.'))[:2]
+        [('Campbell', 'Jen'), ('Sharmin', 'Sadia')]
+        """
+        sharded = cls(workers)
+        try:
+            batches = [[] for _ in range(workers)]
+            pending = [0] * workers
+            for article in articles:
+                shard = shard_of(article[ID], workers)
+                batches[shard].append(article)
+                if len(batches[shard]) == _BATCH_SIZE:
+                    connection = sharded._connections[shard]
+                    if pending[shard] == _MAX_PENDING:
+                        _check(connection.recv())
+                        pending[shard] -= 1
+                    connection.send(('add', (batches[shard],)))
+                    pending[shard] += 1
+                    batches[shard] = []
+            for shard, connection in enumerate(sharded._connections):
+                connection.send(('add', (batches[shard],)))
+                pending[shard] += 1
+            for shard, connection in enumerate(sharded._connections):
+                for _ in range(pending[shard]):
+                    _check(connection.recv())
+        except BaseException:
+            sharded.close()
+            raise
+        return sharded
+
+    def contains_keyword(self, keyword: str) -> list[str]:
+        """Return contains_keyword over all shards."""
+        return list(heapq.merge(*self._scatter('contains_keyword', keyword)))
+
+    def get_coauthors(self, author: NameType) -> list[NameType]:
+        """Return get_coauthors over all shards."""
+        coauthors = set()
+        for partial in self._scatter('get_coauthors', author):
+            coauthors.update(partial)
+        return sorted(coauthors)
+
+    def average_author_count(self) -> float:
+        """Return average_author_count over all shards."""
+        total_authors = 0
+        total_articles = 0
+        for authors, articles in self._scatter('author_count_totals'):
+            total_authors += authors
+            total_articles += articles
+        if total_articles == 0:
+            return 0.0
+        return total_authors / total_articles
+
+    def make_author_to_articles(self) -> dict[NameType, list[str]]:
+        """Return make_author_to_articles over all shards."""
+        postings = {}
+        for partial in self._scatter('make_author_to_articles'):
+            for author, ids in partial.items():
+                postings.setdefault(author, []).append(ids)
+        return {author: list(heapq.merge(*lists))
+                for author, lists in postings.items()}
+
+    def __len__(self) -> int:
+        """Return the number of articles across all shards."""
+        return sum(self._scatter('len'))
+
+    def close(self) -> None:
+        """Stop the worker processes, including any that have died or stopped
+        answering.
+        """
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass  # the worker has already exited
+            try:
+                connection.close()
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join(_STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self) -> 'ShardedArxiv':
+        """Return this corpus, to be closed at the end of a with block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the worker processes."""
+        self.close()
+
+    def _scatter(self, operation: str, *args: Any) -> list[Any]:
+        """Send operation with args to every worker and return their
+        results, in shard order.
+        """
+        for connection in self._connections:
+            connection.send((operation, args))
+        return self._gather()
+
+    def _gather(self) -> list[Any]:
+        """Return the next result of every worker, in shard order. Raise the
+        error of the first worker that failed, if any, but only after every
+        reply has been read, so none is left for a later query.
+        """
+        replies = [connection.recv() for connection in self._connections]
+        return [_check(reply) for reply in replies]
+
+
+def _check(reply: tuple[bool, Any]) -> Any:
+    """Return the result in the worker reply, or raise its error if the
+    worker failed.
+    """
+    failed, result = reply
+    if failed:
+        raise result
+    return result
+
+
+def shard_of(article_id: str, shards: int) -> int:
+    """Return the shard, from 0 to shards - 1, that holds article_id. The
+    same ID always goes to the same shard, in every process.
+
+    >>> shard_of('0704.0002', 4) == shard_of('0704.0002', 4)
+    True
+    >>> 0 <= shard_of('108', 3) < 3
+    True
+    """
+    return zlib.crc32(article_id.encode('utf-8')) % shards
+
+
+def _serve(connection: Any) -> None:
+    """Answer requests from connection over this worker's shard until a None
+    request arrives. Each request is an (operation, args) pair, and each
+    reply is (False, result) or (True, the exception raised).
+    """
+    shard = {}
+    request = connection.recv()
+    while request is not None:
+        operation, args = request
+        try:
+            connection.send((False, _run(shard, operation, args)))
+        except Exception as error:  # report every failure to the coordinator
+            connection.send((True, error))
+        request = connection.recv()
+    connection.close()
+
+
+def _run(shard: ArxivType, operation: str, args: tuple) -> Any:
+    """Return the result of operation with args over shard."""
+    if operation == 'add':
+        for article in args[0]:
+            shard[article[ID]] = article
+        return None
+    if operation == 'len':
+        return len(shard)
+    if operation == 'author_count_totals':
+        return (sum(len(article[AUTHORS]) for article in shard.values()),
+                len(shard))
+    if operation == 'contains_keyword':
+        return arxiv_functions.contains_keyword(shard, *args)
+    if operation == 'get_coauthors':
+        return arxiv_functions.get_coauthors(shard, *args)
+    if operation == 'make_author_to_articles':
+        return arxiv_functions.make_author_to_articles(shard)
+    raise ValueError('unknown operation: {}'.format(operation))
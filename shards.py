@@ -0,0 +1,151 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Keyword and coauthor queries over a corpus split into many shard files
+(such as one data.txt-format file per month), skipping the shards whose
+Bloom filter rules out a match.
+
+Each shard's filter holds its cleaned words (as in contains_keyword) and
+its author names. It is built while the shard is parsed and saved next to
+the shard with the suffix BLOOM_SUFFIX.
+"""
+
+import os
+from typing import Iterator, Optional
+
+from arxiv_functions import (read_arxiv_records, article_words, clean_word,
+                             contains_keyword, get_coauthors)
+from constants import ID, AUTHORS, NameType, ArxivType
+from sketches import BloomFilter
+
+BLOOM_SUFFIX = '.bloom'
+
+
+def read_shard(path: str, false_positive_rate: float
+               ) -> tuple[ArxivType, BloomFilter]:
+    """Return the ArxivType in the shard file at path together with its
+    Bloom filter, built in the same pass, and save the filter next to the
+    shard.
+    """
+    arxiv_data = {}
+    tokens = set()
+    with open(path, encoding='utf-8') as f:
+        for article in read_arxiv_records(f):
+            arxiv_data[article[ID]] = article
+            tokens.update(article_words(article))
+            for author in article[AUTHORS]:
+                tokens.add(_author_token(author))
+
+    bloom = BloomFilter.with_rate(len(tokens), false_positive_rate)
+    for token in tokens:
+        bloom.add(token)
+    with open(path + BLOOM_SUFFIX, 'wb') as f:
+        f.write(bloom.to_bytes())
+    return arxiv_data, bloom
+
+
+def load_shard_filter(path: str, false_positive_rate: float) -> BloomFilter:
+    """Return the saved Bloom filter of the shard at path, building and
+    saving it first if it is missing, older than the shard, or sized for a
+    different false-positive rate.
+    """
+    bloom_path = path + BLOOM_SUFFIX
+    if os.path.exists(bloom_path) and \
+            os.path.getmtime(bloom_path) >= os.path.getmtime(path):
+        with open(bloom_path, 'rb') as f:
+            bloom = BloomFilter.from_bytes(f.read())
+        if bloom.false_positive_rate == false_positive_rate:
+            return bloom
+    return read_shard(path, false_positive_rate)[1]
+
+
+class QueryStats:
+    """How many shards a query searched and how many it pruned."""
+    shards: int
+    pruned: int
+
+    def __init__(self, shards: int, pruned: int) -> None:
+        """Initialize stats for a query over shards shards, pruned of which
+        were skipped.
+        """
+        self.shards = shards
+        self.pruned = pruned
+
+    def __repr__(self) -> str:
+        """Return a representation of these stats."""
+        return 'QueryStats(shards={}, pruned={})'.format(self.shards,
+                                                         self.pruned)
+
+
+class ShardedCorpus:
+    """A corpus stored as shard files, queried shard by shard.
+
+    paths are the shard files. history holds the QueryStats of every query
+    so far, oldest first. _filters maps each shard path to its filter.
+    """
+    paths: list[str]
+    history: list[QueryStats]
+    _filters: dict[str, BloomFilter]
+
+    def __init__(self, paths: list[str],
+                 false_positive_rate: float = 0.01) -> None:
+        """Initialize a corpus of the shards at paths, loading their saved
+        Bloom filters, or building them with the given false-positive rate
+        where missing, out of date or built for another rate.
+        """
+        self.paths = list(paths)
+        self.history = []
+        self._filters = {path: load_shard_filter(path, false_positive_rate)
+                         for path in self.paths}
+
+    def contains_keyword(self, keyword: str) -> list[str]:
+        """Return contains_keyword over the whole corpus, reading only the
+        shards whose filter might contain keyword.
+        """
+        word = clean_word(keyword)
+        ids = []
+        for arxiv_data in self._candidate_shards(word):
+            ids.extend(contains_keyword(arxiv_data, keyword))
+        return sorted(ids)
+
+    def get_coauthors(self, author: NameType) -> list[NameType]:
+        """Return get_coauthors over the whole corpus, reading only the
+        shards whose filter might contain author.
+        """
+        coauthors = set()
+        for arxiv_data in self._candidate_shards(_author_token(author)):
+            coauthors.update(get_coauthors(arxiv_data, author))
+        return sorted(coauthors)
+
+    def last_stats(self) -> Optional[QueryStats]:
+        """Return the QueryStats of the latest query, or None if there has
+        been none.
+        """
+        if not self.history:
+            return None
+        return self.history[-1]
+
+    def _candidate_shards(self, token: str) -> Iterator[ArxivType]:
+        """Yield the ArxivType of each shard whose filter might contain
+        token, reading one shard at a time, and record the query's stats
+        once every shard has been considered.
+        """
+        searched = 0
+        for path in self.paths:
+            if self._filters[path].might_contain(token):
+                searched += 1
+                with open(path, encoding='utf-8') as f:
+                    arxiv_data = {article[ID]: article
+                                  for article in read_arxiv_records(f)}
+                yield arxiv_data
+        self.history.append(QueryStats(len(self.paths),
+                                       len(self.paths) - searched))
+
+
+def _author_token(author: NameType) -> str:
+    """Return the filter token for author. It contains a ':', so it cannot
+    collide with a cleaned word.
+
+    >>> _author_token(('Smith', 'Jacqueline E.'))
+    'author:Smith,Jacqueline E.'
+    """
+    return 'author:{},{}'.format(author[0], author[1])
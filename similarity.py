@@ -0,0 +1,159 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+A "similar articles" engine over sparse TF-IDF vectors of the cleaned title
+and abstract words of each article.
+"""
+
+import heapq
+import math
+import sys
+from typing import Optional
+
+from arxiv_functions import text_words
+from constants import TITLE, ABSTRACT, ArticleType, ArxivType
+
+# A neighbour list: (cosine similarity, article ID) pairs, most similar
+# first.
+NeighboursType = list[tuple[float, str]]
+
+# A word is never left out of the index for being common if it occurs in at
+# most this many articles, so small corpora keep all their words.
+MIN_DF_CUTOFF = 10
+
+
+class SimilarityIndex:
+    """TF-IDF vectors for a collection of articles with an inverted index
+    from each word to the articles that use it.
+
+    _postings maps each word to a list of (article ID, TF-IDF weight) pairs
+    for the articles containing it. _vectors maps each article ID to its
+    sparse vector, a dict from word to weight. _norms maps each article ID
+    to the Euclidean norm of its vector (0.0 for an empty vector).
+
+    last_scored is the number of articles scored by the latest call to
+    most_similar.
+    """
+    last_scored: int
+    _postings: dict[str, list[tuple[str, float]]]
+    _vectors: dict[str, dict[str, float]]
+    _norms: dict[str, float]
+
+    def __init__(self, arxiv_data: ArxivType, max_df: float = 0.1) -> None:
+        """Initialize the TF-IDF index of the articles in arxiv_data.
+
+        Words that occur in more than the fraction max_df of the articles
+        (and in more than MIN_DF_CUTOFF articles), such as 'the' and 'of', are
+        left out of every vector: they say little about what an article is
+        about, and their long posting lists would make most_similar score
+        nearly every article.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> index = SimilarityIndex(EXAMPLE_ARXIV)
+        >>> [article_id for _, article_id in index.most_similar('108', 2)]
+        ['5090', '0001']
+        """
+        counts = {}
+        document_frequency = {}
+        for article_id, article in arxiv_data.items():
+            counts[article_id] = _word_counts(article)
+            for word in counts[article_id]:
+                document_frequency[word] = document_frequency.get(word, 0) + 1
+
+        total = len(arxiv_data)
+        cutoff = max(max_df * total, MIN_DF_CUTOFF)
+        self.last_scored = 0
+        self._postings = {}
+        self._vectors = {}
+        self._norms = {}
+        for article_id, word_counts in counts.items():
+            vector = {}
+            for word, count in word_counts.items():
+                if document_frequency[word] > cutoff:
+                    continue
+                weight = (1 + math.log(count)) * \
+                    math.log(total / document_frequency[word])
+                if weight > 0:
+                    vector[word] = weight
+                    self._postings.setdefault(word, []).append(
+                        (article_id, weight))
+            self._vectors[article_id] = vector
+            self._norms[article_id] = math.sqrt(
+                sum(weight * weight for weight in vector.values()))
+
+    def most_similar(self, article_id: str, k: int) -> NeighboursType:
+        """Return the at most k articles, other than article_id, with the
+        highest positive cosine similarity to article_id, most similar first
+        and ties broken by ID. Return [] if article_id is not indexed.
+
+        Only the articles sharing a word with article_id are scored, by
+        accumulating partial dot products over the inverted index.
+        """
+        norm = self._norms.get(article_id, 0.0)
+        if norm == 0.0:
+            return []
+
+        dot_products = {}
+        for word, weight in self._vectors[article_id].items():
+            for other_id, other_weight in self._postings[word]:
+                dot_products[other_id] = (dot_products.get(other_id, 0.0) +
+                                          weight * other_weight)
+        del dot_products[article_id]
+        self.last_scored = len(dot_products)
+
+        best = heapq.nsmallest(
+            k, ((-dot / (norm * self._norms[other_id]), other_id)
+                for other_id, dot in dot_products.items()))
+        return [(-negated, other_id) for negated, other_id in best]
+
+    def all_neighbours(self, k: int, memory_budget: Optional[int] = None
+                       ) -> dict[str, NeighboursType]:
+        """Return a dict that maps each indexed article ID to
+        most_similar(article_id, k).
+
+        If memory_budget is given, stop before the neighbour lists would take
+        more than memory_budget bytes (as estimated by sys.getsizeof) and
+        return only the lists built so far. Articles are processed in sorted
+        ID order, so a later call to neighbours_from can resume after the
+        largest ID returned.
+        """
+        return self.neighbours_from(None, k, memory_budget)
+
+    def neighbours_from(self, after_id: Optional[str], k: int,
+                        memory_budget: Optional[int] = None
+                        ) -> dict[str, NeighboursType]:
+        """Return all_neighbours(k, memory_budget), restricted to the
+        article IDs that come after after_id in sorted order (all IDs if
+        after_id is None).
+        """
+        neighbours = {}
+        used = sys.getsizeof(neighbours)
+        for article_id in sorted(self._vectors):
+            if after_id is not None and article_id <= after_id:
+                continue
+            similar = self.most_similar(article_id, k)
+            used += _neighbours_size(similar)
+            if memory_budget is not None and used > memory_budget:
+                break
+            neighbours[article_id] = similar
+        return neighbours
+
+
+def _word_counts(article: ArticleType) -> dict[str, int]:
+    """Return a dict that maps each cleaned word of the title and abstract
+    of article to the number of times it occurs.
+
+    >>> _word_counts({TITLE: 'Cats, cats!', ABSTRACT: 'and dogs'})
+    {'cats': 2, 'and': 1, 'dogs': 1}
+    """
+    counts = {}
+    for word in text_words(article):
+        counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+def _neighbours_size(neighbours: NeighboursType) -> int:
+    """Return an estimate, in bytes, of the memory used by neighbours."""
+    size = sys.getsizeof(neighbours)
+    for pair in neighbours:
+        size += sys.getsizeof(pair) + sys.getsizeof(pair[0])
+    return size
@@ -0,0 +1,266 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Fixed-size probabilistic summaries of streams of words.
+"""
+
+import hashlib
+import heapq
+import math
+import struct
+from array import array
+from typing import Iterator
+
+# The header of a serialized BloomFilter: bits, hashes and
+# false_positive_rate.
+_HEADER = '<QId'
+
+def hash_pair(word: str) -> tuple[int, int]:
+    """Return two independent 64-bit hashes of word. Unlike hash, the
+    result is the same in every process, so summaries built in different
+    processes can be merged.
+
+    >>> hash_pair('cats') == hash_pair('cats')
+    True
+    >>> hash_pair('cats') == hash_pair('dogs')
+    False
+    """
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=16).digest()
+    return (int.from_bytes(digest[:8], 'little'),
+            int.from_bytes(digest[8:], 'little') | 1)
+
+
+class CountMinSketch:
+    """A Count-Min sketch: approximate counts of words in a fixed-size table
+    of depth rows and width columns. An estimate is never below the true
+    count, and with probability at least 1 - delta it is at most
+    epsilon * total above it, where width = ceil(e / epsilon) and
+    depth = ceil(ln(1 / delta)).
+
+    total is the sum of all counts added.
+    """
+    width: int
+    depth: int
+    total: int
+    _table: list[array]
+
+    def __init__(self, width: int, depth: int) -> None:
+        """Initialize an empty sketch with depth rows of width counters."""
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._table = [array('q', bytes(8 * width)) for _ in range(depth)]
+
+    @classmethod
+    def with_error(cls, epsilon: float, delta: float) -> 'CountMinSketch':
+        """Return an empty sketch whose estimates are within epsilon * total
+        of the true counts with probability at least 1 - delta.
+
+        >>> sketch = CountMinSketch.with_error(0.01, 0.01)
+        >>> sketch.width, sketch.depth
+        (272, 5)
+        """
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    def add(self, word: str, count: int = 1) -> int:
+        """Add count occurrences of word and return its new estimate.
+
+        >>> sketch = CountMinSketch(50, 4)
+        >>> sketch.add('cats')
+        1
+        >>> sketch.add('cats', 2)
+        3
+        >>> sketch.estimate('cats'), sketch.estimate('dogs')
+        (3, 0)
+        """
+        self.total += count
+        h1, h2 = hash_pair(word)
+        estimate = None
+        for i in range(self.depth):
+            row = self._table[i]
+            column = (h1 + i * h2) % self.width
+            row[column] += count
+            if estimate is None or row[column] < estimate:
+                estimate = row[column]
+        return estimate
+
+    def estimate(self, word: str) -> int:
+        """Return the estimated count of word."""
+        h1, h2 = hash_pair(word)
+        return min(self._table[i][(h1 + i * h2) % self.width]
+                   for i in range(self.depth))
+
+    def merge(self, other: 'CountMinSketch') -> None:
+        """Add the counts in other, which has the same shape, to this sketch.
+        """
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError('cannot merge sketches of different shapes')
+        self.total += other.total
+        for row, other_row in zip(self._table, other._table):
+            for column in range(self.width):
+                row[column] += other_row[column]
+
+
+class HeavyHitters:
+    """The (at most) k words with the highest estimated counts in a
+    CountMinSketch, updated as words are added.
+
+    _counts maps each tracked word to its latest estimate. _heap holds
+    (estimate, word) pairs, some stale, with the smallest tracked estimate
+    on top once stale pairs are dropped.
+    """
+    k: int
+    sketch: CountMinSketch
+    _counts: dict[str, int]
+    _heap: list[tuple[int, str]]
+
+    def __init__(self, k: int, sketch: CountMinSketch) -> None:
+        """Initialize an empty tracker of the top k words of sketch."""
+        self.k = k
+        self.sketch = sketch
+        self._counts = {}
+        self._heap = []
+
+    def add(self, word: str, count: int = 1) -> None:
+        """Add count occurrences of word to the sketch and track it if it is
+        now among the top k.
+
+        >>> top = HeavyHitters(2, CountMinSketch(50, 4))
+        >>> for word in 'a b a c a c b c c'.split():
+        ...     top.add(word)
+        >>> top.top()
+        [('c', 4), ('a', 3)]
+        """
+        self._offer(word, self.sketch.add(word, count))
+
+    def top(self) -> list[tuple[str, int]]:
+        """Return the tracked (word, estimate) pairs, highest estimate first
+        and ties broken by word.
+        """
+        return sorted(self._counts.items(), key=lambda item: (-item[1],
+                                                              item[0]))
+
+    def merge(self, other: 'HeavyHitters') -> None:
+        """Merge other, over a sketch of the same shape, into this tracker
+        and re-rank the words tracked by either.
+        """
+        self.sketch.merge(other.sketch)
+        candidates = set(self._counts) | set(other._counts)
+        self._counts = {}
+        self._heap = []
+        for word in candidates:
+            self._offer(word, self.sketch.estimate(word))
+
+    def _offer(self, word: str, estimate: int) -> None:
+        """Track word with the given estimate if it is among the top k."""
+        if word in self._counts:
+            self._counts[word] = estimate
+            heapq.heappush(self._heap, (estimate, word))
+        elif len(self._counts) < self.k:
+            self._counts[word] = estimate
+            heapq.heappush(self._heap, (estimate, word))
+        elif self._counts:
+            smallest, smallest_word = self._smallest()
+            if estimate > smallest:
+                del self._counts[smallest_word]
+                heapq.heappop(self._heap)
+                self._counts[word] = estimate
+                heapq.heappush(self._heap, (estimate, word))
+        if len(self._heap) > 4 * self.k + 16:
+            self._heap = [(count, tracked)
+                          for tracked, count in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def _smallest(self) -> tuple[int, str]:
+        """Return the (estimate, word) pair of the tracked word with the
+        smallest estimate, dropping stale pairs from the top of the heap.
+        """
+        while self._counts.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+
+class BloomFilter:
+    """A Bloom filter: a fixed-size set of words that may report a word it
+    does not contain (a false positive), but never misses a word it does.
+
+    bits is the number of bits, and hashes the number of bit positions set
+    per word. false_positive_rate is the rate the filter was sized for by
+    with_rate, or 0.0 if it was sized directly. _bits holds the bits, 8 per
+    byte.
+    """
+    bits: int
+    hashes: int
+    false_positive_rate: float
+    _bits: bytearray
+
+    def __init__(self, bits: int, hashes: int) -> None:
+        """Initialize an empty filter of bits bits and hashes hash functions.
+        """
+        self.bits = max(bits, 1)
+        self.hashes = max(hashes, 1)
+        self.false_positive_rate = 0.0
+        self._bits = bytearray((self.bits + 7) // 8)
+
+    @classmethod
+    def with_rate(cls, capacity: int, false_positive_rate: float
+                  ) -> 'BloomFilter':
+        """Return an empty filter sized so that after capacity words are
+        added, the false-positive rate is about false_positive_rate.
+
+        >>> bloom = BloomFilter.with_rate(1000, 0.01)
+        >>> bloom.bits, bloom.hashes
+        (9586, 7)
+        """
+        capacity = max(capacity, 1)
+        bits = math.ceil(-capacity * math.log(false_positive_rate) /
+                         math.log(2) ** 2)
+        bloom = cls(bits, round(bits / capacity * math.log(2)))
+        bloom.false_positive_rate = false_positive_rate
+        return bloom
+
+    def add(self, word: str) -> None:
+        """Add word to the filter.
+
+        >>> bloom = BloomFilter.with_rate(10, 0.01)
+        >>> bloom.add('cats')
+        >>> bloom.might_contain('cats'), bloom.might_contain('dogs')
+        (True, False)
+        """
+        for position in self._positions(word):
+            self._bits[position // 8] |= 1 << (position % 8)
+
+    def might_contain(self, word: str) -> bool:
+        """Return False if word was certainly never added, and True if it
+        probably was.
+        """
+        for position in self._positions(word):
+            if not self._bits[position // 8] & (1 << (position % 8)):
+                return False
+        return True
+
+    def to_bytes(self) -> bytes:
+        """Return this filter serialized, to be read back by from_bytes.
+
+        >>> bloom = BloomFilter.with_rate(10, 0.01)
+        >>> bloom.add('cats')
+        >>> copy = BloomFilter.from_bytes(bloom.to_bytes())
+        >>> copy.false_positive_rate, copy.might_contain('cats')
+        (0.01, True)
+        """
+        return struct.pack(_HEADER, self.bits, self.hashes,
+                           self.false_positive_rate) + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        """Return the filter serialized in data by to_bytes."""
+        bits, hashes, false_positive_rate = struct.unpack_from(_HEADER, data)
+        bloom = cls(bits, hashes)
+        bloom.false_positive_rate = false_positive_rate
+        bloom._bits = bytearray(data[struct.calcsize(_HEADER):])
+        return bloom
+
+    def _positions(self, word: str) -> Iterator[int]:
+        """Yield the bit positions of word."""
+        h1, h2 = hash_pair(word)
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
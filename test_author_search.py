@@ -0,0 +1,55 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for author_search.
+"""
+
+import pytest
+import arxiv_functions
+import author_search
+
+
+def test_results_are_coauthor_keys(arxiv_data) -> None:
+    """Test that search results can be passed straight to get_coauthors."""
+    index = author_search.AuthorIndex(arxiv_data)
+    assert index.search('chablat') == [('Chablat', 'Damien')]
+    assert index.search('varanasi m k')[0] == ('Varanasi', 'Mahesh K.')
+    author = index.search('Damien Chablat')[0]
+    assert arxiv_functions.get_coauthors(arxiv_data, author) != []
+
+
+def test_comma_form_and_initials() -> None:
+    """Test "last, first" queries and initials on either side."""
+    index = author_search.AuthorIndex()
+    index.add_author(('Smith', 'J. E.'))
+    index.add_author(('Smithson', 'Jane'))
+    index.add_author(('Smith', 'Paul'))
+    assert index.search('smith, jacqueline e') == [('Smith', 'J. E.')]
+    assert index.search('smith j') == [('Smith', 'J. E.'),
+                                       ('Smithson', 'Jane')]
+    assert index.search('smith') == [('Smith', 'J. E.'), ('Smith', 'Paul'),
+                                     ('Smithson', 'Jane')]
+
+
+def test_adds_after_search() -> None:
+    """Test that authors added after a search are found by the next one."""
+    index = author_search.AuthorIndex()
+    index.add_author(('Smith', 'Paul'))
+    assert index.search('smith') == [('Smith', 'Paul')]
+    index.add_author(('Adams', 'Ann'))
+    index.add_author(('Smithers', 'Waylon'))
+    assert index.search('smith') == [('Smith', 'Paul'), ('Smithers', 'Waylon')]
+    assert index.search('adams') == [('Adams', 'Ann')]
+
+
+def test_accents_and_no_match() -> None:
+    """Test accent-insensitive lookup and queries with no match."""
+    index = author_search.AuthorIndex()
+    index.add_author(('Erdős', 'Pál'))
+    assert index.search('erdos p') == [('Erdős', 'Pál')]
+    assert index.search('ERDŐS') == [('Erdős', 'Pál')]
+    assert index.search('nobody') == []
+    assert index.search('') == []
+
+
+if __name__ == '__main__':
+    pytest.main(['test_author_search.py'])
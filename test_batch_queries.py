@@ -0,0 +1,45 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for contains_keywords, get_coauthors_many and created_in_years.
+"""
+
+import pytest
+import arxiv_functions
+from constants import AUTHORS
+
+
+def test_contains_keywords_matches_single_queries(arxiv_data) -> None:
+    """Test contains_keywords against one contains_keyword call per keyword.
+    """
+    keywords = ['graph', 'Quantum', 'the', 'chablat', 'notaword', 'graph']
+    actual = arxiv_functions.contains_keywords(arxiv_data, keywords)
+    assert list(actual) == ['graph', 'Quantum', 'the', 'chablat', 'notaword']
+    for keyword in keywords:
+        expected = arxiv_functions.contains_keyword(arxiv_data, keyword)
+        assert actual[keyword] == expected
+    assert actual['notaword'] == []
+
+
+def test_get_coauthors_many_matches_single_queries(arxiv_data) -> None:
+    """Test get_coauthors_many against one get_coauthors call per author."""
+    authors = [('Chablat', 'Damien'), ('Varanasi', 'Mahesh K.'),
+               ('Robin', 'Lin')]
+    for article in list(arxiv_data.values())[:20]:
+        authors.extend(article[AUTHORS])
+    actual = arxiv_functions.get_coauthors_many(arxiv_data, authors)
+    for author in authors:
+        assert actual[author] == \
+            arxiv_functions.get_coauthors(arxiv_data, author)
+
+
+def test_created_in_years(arxiv_data) -> None:
+    """Test created_in_years against one created_in_year call per ID."""
+    ids = sorted(arxiv_data)[:50] + ['missing']
+    actual = arxiv_functions.created_in_years(arxiv_data, ids, 2007)
+    for id in ids:
+        assert actual[id] == \
+            arxiv_functions.created_in_year(arxiv_data, id, 2007)
+
+
+if __name__ == '__main__':
+    pytest.main(['test_batch_queries.py'])
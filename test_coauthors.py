@@ -0,0 +1,154 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for coauthors.
+"""
+
+import pytest
+import arxiv_functions
+import coauthors
+from constants import ID, CREATED, AUTHORS
+
+TEST_ARXIV = arxiv_functions.EXAMPLE_ARXIV
+
+
+def test_clusters_match_coauthor_closure() -> None:
+    """Test that every coauthor from get_coauthors is in the same cluster."""
+    clusters = coauthors.AuthorClusters(TEST_ARXIV)
+    author = ('Smith', 'Jacqueline E.')
+    for coauthor in arxiv_functions.get_coauthors(TEST_ARXIV, author):
+        assert clusters.same_cluster(author, coauthor)
+
+
+def test_largest_cluster() -> None:
+    """Test the membership of the largest cluster."""
+    clusters = coauthors.AuthorClusters(TEST_ARXIV)
+    expected = [('Campbell', 'Jen'), ('Sharmin', 'Sadia'),
+                ('Smith', 'Jacqueline E.'), ('Yanez', 'Fernando'),
+                ('Zavaleta-Bernuy', 'Angela')]
+    assert clusters.largest_cluster() == expected
+    assert clusters.cluster_count() == 2
+
+
+def test_incremental_merge() -> None:
+    """Test that a new article joins two existing clusters."""
+    clusters = coauthors.AuthorClusters(TEST_ARXIV)
+    tovi = ('Grossman', 'Tovi')
+    jen = ('Campbell', 'Jen')
+    assert not clusters.same_cluster(tovi, jen)
+    clusters.add_article({ID: '7', AUTHORS: [tovi, jen]})
+    assert clusters.same_cluster(tovi, jen)
+    assert clusters.cluster_sizes() == [6]
+
+
+def test_unknown_authors() -> None:
+    """Test same_cluster with authors that wrote nothing."""
+    clusters = coauthors.AuthorClusters(TEST_ARXIV)
+    assert clusters.same_cluster(('Robin', 'Lin'), ('Robin', 'Lin'))
+    assert not clusters.same_cluster(('Robin', 'Lin'), ('Grossman', 'Tovi'))
+    assert clusters.cluster_of(('Robin', 'Lin')) == []
+
+
+def _bfs_distance(arxiv: dict, source: tuple, target: tuple) -> int:
+    """Return the coauthor distance from source to target using only
+    get_coauthors, or -1 if they are not connected.
+    """
+    seen = {source}
+    frontier = [source]
+    distance = 0
+    while frontier:
+        if target in frontier:
+            return distance
+        next_frontier = []
+        for author in frontier:
+            for coauthor in arxiv_functions.get_coauthors(arxiv, author):
+                if coauthor not in seen:
+                    seen.add(coauthor)
+                    next_frontier.append(coauthor)
+        frontier = next_frontier
+        distance += 1
+    return -1
+
+
+def test_path_is_valid_chain() -> None:
+    """Test that a returned path links each pair of authors by an article
+    they both wrote.
+    """
+    graph = coauthors.CoauthorGraph(TEST_ARXIV)
+    distance, authors, ids = graph.path(('Sharmin', 'Sadia'),
+                                        ('Yanez', 'Fernando'))
+    assert distance == 3 == len(ids) == len(authors) - 1
+    for i in range(distance):
+        article_authors = TEST_ARXIV[ids[i]][AUTHORS]
+        assert authors[i] in article_authors
+        assert authors[i + 1] in article_authors
+
+
+def test_distances_match_plain_bfs(arxiv_data) -> None:
+    """Test bidirectional and cached-anchor distances against a plain BFS
+    over get_coauthors.
+    """
+    anchor = ('Chablat', 'Damien')
+    graph = coauthors.CoauthorGraph(arxiv_data, hub_degree=1000)
+    cached = coauthors.CoauthorGraph(arxiv_data, hub_degree=1000)
+    cached.add_anchor(anchor)
+    targets = [('Streinu', 'Ileana')]
+    for coauthor in graph.coauthors(anchor):
+        targets.extend(graph.coauthors(coauthor)[:3])
+    for target in targets:
+        expected = _bfs_distance(arxiv_data, anchor, target)
+        assert graph.distance(anchor, target) == expected
+        assert cached.distance(target, anchor) == expected
+
+
+def test_hub_tree_built_after_repeated_queries() -> None:
+    """Test that a hub's BFS tree is only built once the hub has been in
+    hub_queries queries, and that paths agree before and after.
+    """
+    hub = ('Smith', 'Jacqueline E.')
+    graph = coauthors.CoauthorGraph(TEST_ARXIV, hub_degree=3, hub_queries=2)
+    first = graph.path(hub, ('Yanez', 'Fernando'))
+    assert graph._anchors == {}
+    assert graph.path(('Sharmin', 'Sadia'), hub)[0] == 1
+    assert list(graph._anchors) == [hub]
+    assert graph.path(hub, ('Yanez', 'Fernando')) == first
+
+
+def test_no_path() -> None:
+    """Test path for unconnected and unknown authors."""
+    graph = coauthors.CoauthorGraph(TEST_ARXIV, hub_degree=1)
+    assert graph.path(('Grossman', 'Tovi'), ('Campbell', 'Jen')) is None
+    assert graph.path(('Robin', 'Lin'), ('Campbell', 'Jen')) is None
+    assert graph.path(('Campbell', 'Jen'), ('Campbell', 'Jen')) == \
+        (0, [('Campbell', 'Jen')], [])
+
+
+def test_temporal_matches_filtered_rebuild(arxiv_data) -> None:
+    """Test coauthors_between and as_of against get_coauthors over the
+    articles created in the same years.
+    """
+    graph = coauthors.TemporalCoauthorGraph(arxiv_data)
+    author = ('Chablat', 'Damien')
+    for first_year, last_year in [(2007, 2007), (2005, 2008), (1990, 2006)]:
+        in_range = {id: article for id, article in arxiv_data.items()
+                    if article[CREATED][:4].isdigit() and
+                    first_year <= int(article[CREATED][:4]) <= last_year}
+        expected = arxiv_functions.get_coauthors(in_range, author)
+        assert graph.coauthors_between(author, first_year,
+                                       last_year) == expected
+        if first_year == 1990:
+            assert graph.as_of(last_year).coauthors(author) == expected
+
+
+def test_snapshot_edges() -> None:
+    """Test the links and authors of a snapshot of the example data."""
+    graph = coauthors.TemporalCoauthorGraph(TEST_ARXIV)
+    assert list(graph.as_of(2022).edges()) == []
+    snapshot = graph.window(2023, None)
+    assert len(list(snapshot.edges())) == 4
+    assert ('Yanez', 'Fernando') not in snapshot.authors()
+    assert graph.link_years(('Sharmin', 'Sadia'),
+                            ('Smith', 'Jacqueline E.')) == [2023]
+
+
+if __name__ == '__main__':
+    pytest.main(['test_coauthors.py'])
@@ -0,0 +1,60 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for contains_keyword.
+"""
+
+import pytest
+import arxiv_functions
+from constants import ID, TITLE, CREATED, MODIFIED, AUTHORS, ABSTRACT
+
+TEST_ARXIV = {
+    '1': {
+        ID: '1',
+        TITLE: 'Graph Theory for Everyone',
+        CREATED: '2023-01-01',
+        MODIFIED: '',
+        AUTHORS: [('Zavaleta-Bernuy', 'Angela'), ('Smith', 'Jacqueline E.')],
+        ABSTRACT: 'We study graphs.\nMany, many graphs!'},
+    '2': {
+        ID: '2',
+        TITLE: 'Quantum',
+        CREATED: '2023-02-02',
+        MODIFIED: '',
+        AUTHORS: [],
+        ABSTRACT: "Don't panic."}
+}
+
+
+def test_word_in_multi_word_title() -> None:
+    """Test a keyword that is one word of a multi-word title."""
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'theory') == ['1']
+
+
+def test_word_in_abstract_with_punctuation() -> None:
+    """Test a keyword next to punctuation on a later abstract line."""
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'graphs') == ['1']
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'dont') == ['2']
+
+
+def test_author_name_words() -> None:
+    """Test keywords that are single words of an author's names."""
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'Jacqueline') == ['1']
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'zavaletabernuy') == \
+        ['1']
+
+
+def test_no_partial_or_joined_matches() -> None:
+    """Test that a keyword must match a whole cleaned word."""
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'graph') == ['1']
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'grap') == []
+    assert arxiv_functions.contains_keyword(TEST_ARXIV,
+                                            'graphtheory') == []
+
+
+def test_single_word_title() -> None:
+    """Test a keyword that is the whole title, in a different case."""
+    assert arxiv_functions.contains_keyword(TEST_ARXIV, 'QUANTUM!') == ['2']
+
+
+if __name__ == '__main__':
+    pytest.main(['test_contains_keyword.py'])
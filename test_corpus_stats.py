@@ -0,0 +1,58 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for corpus_stats.
+"""
+
+import pytest
+import arxiv_functions
+import corpus_stats
+
+TEST_ARXIV = arxiv_functions.EXAMPLE_ARXIV
+
+
+def test_matches_average_author_count() -> None:
+    """Test that the mean author count agrees with average_author_count."""
+    actual = corpus_stats.corpus_stats(TEST_ARXIV).mean_author_count()
+    expected = arxiv_functions.average_author_count(TEST_ARXIV)
+    assert actual == expected
+
+
+def test_lag_and_abstract_lengths() -> None:
+    """Test the modified-vs-created lag histogram and abstract percentiles."""
+    stats = corpus_stats.corpus_stats(TEST_ARXIV)
+    assert stats.lag_days_hist == {5: 1, 43: 1, 1: 1}
+    assert stats.abstract_length_percentile(0) == 8
+    assert stats.abstract_length_percentile(100) == 20
+
+
+def test_merge_of_shards_equals_whole() -> None:
+    """Test that merging per-shard statistics gives the whole-corpus
+    statistics.
+    """
+    ids = sorted(TEST_ARXIV)
+    left = corpus_stats.corpus_stats([TEST_ARXIV[i] for i in ids[:2]])
+    right = corpus_stats.corpus_stats([TEST_ARXIV[i] for i in ids[2:]])
+    left.merge(right)
+    whole = corpus_stats.corpus_stats(TEST_ARXIV)
+    assert vars(left) == vars(whole)
+
+
+def test_empty_corpus() -> None:
+    """Test the statistics of an empty corpus."""
+    stats = corpus_stats.corpus_stats({})
+    assert stats.mean_author_count() == 0.0
+    assert stats.median_author_count() == 0.0
+    assert stats.abstract_length_percentile(50) == 0
+
+
+def test_record_stream(example_data_path) -> None:
+    """Test statistics computed over a stream of records from a file."""
+    with open(example_data_path) as f:
+        records = arxiv_functions.read_arxiv_records(f)
+        stats = corpus_stats.corpus_stats(records)
+    assert stats.article_count == len(TEST_ARXIV)
+    assert vars(stats) == vars(corpus_stats.corpus_stats(TEST_ARXIV))
+
+
+if __name__ == '__main__':
+    pytest.main(['test_corpus_stats.py'])
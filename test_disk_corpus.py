@@ -0,0 +1,48 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for disk_corpus.
+"""
+
+import pytest
+import arxiv_functions
+import disk_corpus
+
+
+def test_spilled_store_matches_in_memory(tmp_path, arxiv_data,
+                                         data_path) -> None:
+    """Test a store built through many spilled runs against the in-memory
+    ArxivType.
+    """
+    with open(data_path) as f:
+        runs = disk_corpus.ingest(f, str(tmp_path), 50000)
+    assert runs > 1
+
+    with disk_corpus.DiskCorpus(str(tmp_path)) as corpus:
+        assert len(corpus) == len(arxiv_data)
+        assert dict(corpus.items()) == arxiv_data
+        by_author = arxiv_functions.make_author_to_articles(arxiv_data)
+        assert sorted(corpus.authors()) == sorted(by_author)
+        for author in list(by_author)[:100]:
+            assert corpus.author_articles(author) == by_author[author]
+        assert corpus.author_articles(('Robin', 'Lin')) == []
+
+
+def test_query_functions_read_store(tmp_path, example_data_path) -> None:
+    """Test that the query functions accept a DiskCorpus."""
+    with open(example_data_path) as f:
+        assert disk_corpus.ingest(f, str(tmp_path), 10 ** 6) == 1
+
+    example = arxiv_functions.EXAMPLE_ARXIV
+    with disk_corpus.DiskCorpus(str(tmp_path)) as corpus:
+        assert '108' in corpus
+        assert 'nope' not in corpus
+        assert arxiv_functions.contains_keyword(corpus, 'cats') == ['0001']
+        author = ('Smith', 'Jacqueline E.')
+        assert arxiv_functions.get_coauthors(corpus, author) == \
+            arxiv_functions.get_coauthors(example, author)
+        assert arxiv_functions.average_author_count(corpus) == \
+            arxiv_functions.average_author_count(example)
+
+
+if __name__ == '__main__':
+    pytest.main(['test_disk_corpus.py'])
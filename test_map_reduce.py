@@ -0,0 +1,44 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for map_reduce.
+"""
+
+import pytest
+import arxiv_functions
+import map_reduce
+
+
+def test_split_file_on_end_boundaries(data_path) -> None:
+    """Test that split_file covers the file with ranges ending after END."""
+    ranges = map_reduce.split_file(data_path, 4)
+    assert ranges[0][0] == 0
+    with open(data_path, 'rb') as f:
+        data = f.read()
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        assert data[:end].endswith(b'END\n')
+
+
+def test_author_to_articles_example(example_data_path) -> None:
+    """Test author_to_articles on the example data in this process."""
+    actual = map_reduce.author_to_articles(example_data_path, workers=1)
+    assert actual == arxiv_functions.EXAMPLE_BY_AUTHOR
+
+
+def test_parallel_jobs_match_single_process(arxiv_data, data_path) -> None:
+    """Test the built-in jobs over several worker processes."""
+    expected = arxiv_functions.make_author_to_articles(arxiv_data)
+    assert map_reduce.author_to_articles(data_path, workers=3) == expected
+
+    counts = map_reduce.author_counts(data_path, workers=3)
+    assert counts == {author: len(set(ids))
+                      for author, ids in expected.items()}
+
+    actual = map_reduce.average_author_count(data_path, workers=3)
+    assert actual == pytest.approx(
+        arxiv_functions.average_author_count(arxiv_data))
+
+
+if __name__ == '__main__':
+    pytest.main(['test_map_reduce.py'])
@@ -0,0 +1,61 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for memory_report.
+"""
+
+import pytest
+import arxiv_functions
+import memory_report
+
+
+def test_breakdown_adds_up(arxiv_data) -> None:
+    """Test that the breakdown of the ArxivType adds up to its estimate."""
+    report = memory_report.memory_report(arxiv_data)
+    assert report.article_count == len(arxiv_data)
+    assert report.strings > report.author_tuples > 0
+    assert report.containers > 0
+    assert report.estimated() == report.total()
+    assert report.per_article() == report.estimated() / len(arxiv_data)
+
+
+def test_measured_close_to_estimated(data_path) -> None:
+    """Test that the sizes measured while building the ArxivType and a
+    derived structure are close to their estimates.
+    """
+    with open(data_path) as f:
+        arxiv, arxiv_size = memory_report.measure(
+            lambda: arxiv_functions.read_arxiv_file(f))
+    by_author, by_author_size = memory_report.measure(
+        lambda: arxiv_functions.make_author_to_articles(arxiv))
+    report = memory_report.memory_report(
+        arxiv, {'by author': by_author},
+        {'arxiv': arxiv_size, 'by author': by_author_size})
+    assert report.measured == pytest.approx(report.estimated(), rel=0.2)
+    estimated, measured = report.derived['by author']
+    assert measured == pytest.approx(estimated, rel=0.2)
+    assert report.total() == report.estimated() + estimated
+
+
+def test_unmeasured_sizes_are_not_reported(arxiv_data) -> None:
+    """Test that structures not built with measure have no measured size
+    and are shown as n/a.
+    """
+    by_author = arxiv_functions.make_author_to_articles(arxiv_data)
+    report = memory_report.memory_report(arxiv_data, {'by author': by_author})
+    assert report.measured is None
+    assert report.derived['by author'][1] is None
+    lines = str(report).splitlines()
+    assert lines[6].split()[-1] == 'n/a'
+    assert lines[8].split()[-1] == 'n/a'
+
+
+def test_empty_data() -> None:
+    """Test a report on an empty ArxivType."""
+    report = memory_report.memory_report({})
+    assert report.per_article() == 0.0
+    assert report.projected(1000) == 1000 * report.total()
+    assert 'articles' in str(report)
+
+
+if __name__ == '__main__':
+    pytest.main(['test_memory_report.py'])
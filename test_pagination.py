@@ -0,0 +1,64 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for pagination.
+"""
+
+import pytest
+import arxiv_functions
+import pagination
+
+
+def _all_pages(next_page, page_size: int) -> list:
+    """Return the IDs of every page returned by next_page(page_size, cursor),
+    checking that every page but the last is full.
+    """
+    ids, cursor = next_page(page_size, None)
+    result = list(ids)
+    while cursor is not None:
+        assert len(ids) == page_size
+        ids, cursor = next_page(page_size, cursor)
+        result.extend(ids)
+    return result
+
+
+def test_keyword_pages_match_contains_keyword(arxiv_data) -> None:
+    """Test that the keyword pages put together equal contains_keyword."""
+    index = pagination.PostingIndex(arxiv_data)
+    for keyword in ['the', 'graph', 'notaword']:
+        actual = _all_pages(
+            lambda size, cursor: index.keyword_page([keyword], size, cursor),
+            7)
+        assert actual == arxiv_functions.contains_keyword(arxiv_data, keyword)
+
+
+def test_merged_keyword_pages(arxiv_data) -> None:
+    """Test pages of the union of several keywords' posting lists."""
+    index = pagination.PostingIndex(arxiv_data)
+    keywords = ['graph', 'graphs', 'quantum']
+    expected = set()
+    for keyword in keywords:
+        expected.update(arxiv_functions.contains_keyword(arxiv_data, keyword))
+    actual = _all_pages(
+        lambda size, cursor: index.keyword_page(keywords, size, cursor), 10)
+    assert actual == sorted(expected)
+
+
+def test_author_pages(arxiv_data) -> None:
+    """Test that the author pages equal make_author_to_articles."""
+    index = pagination.PostingIndex(arxiv_data)
+    author = ('Chablat', 'Damien')
+    actual = _all_pages(
+        lambda size, cursor: index.author_page(author, size, cursor), 2)
+    assert actual == arxiv_functions.make_author_to_articles(arxiv_data)[author]
+    assert index.author_page(('Robin', 'Lin'), 5) == ([], None)
+
+
+def test_invalid_cursor() -> None:
+    """Test that a corrupted cursor is rejected."""
+    index = pagination.PostingIndex(arxiv_functions.EXAMPLE_ARXIV)
+    with pytest.raises(ValueError):
+        index.keyword_page(['we'], 2, 'not a cursor!')
+
+
+if __name__ == '__main__':
+    pytest.main(['test_pagination.py'])
@@ -0,0 +1,97 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for scatter_gather.
+"""
+
+import multiprocessing
+import pytest
+import arxiv_functions
+import scatter_gather
+from constants import ID
+
+
+def test_matches_single_process(arxiv_data, data_path) -> None:
+    """Test every query against the single-process functions."""
+    with open(data_path) as f:
+        sharded = scatter_gather.ShardedArxiv.from_articles(
+            arxiv_functions.read_arxiv_records(f), 3)
+    with sharded:
+        assert len(sharded) == len(arxiv_data)
+        for keyword in ['the', 'graph', 'notaword']:
+            assert sharded.contains_keyword(keyword) == \
+                arxiv_functions.contains_keyword(arxiv_data, keyword)
+        for author in [('Chablat', 'Damien'), ('Robin', 'Lin')]:
+            assert sharded.get_coauthors(author) == \
+                arxiv_functions.get_coauthors(arxiv_data, author)
+        assert sharded.average_author_count() == \
+            arxiv_functions.average_author_count(arxiv_data)
+        assert sharded.make_author_to_articles() == \
+            arxiv_functions.make_author_to_articles(arxiv_data)
+
+
+def test_many_small_batches(monkeypatch, arxiv_data) -> None:
+    """Test loading when workers receive many batches."""
+    monkeypatch.setattr(scatter_gather, '_BATCH_SIZE', 5)
+    with scatter_gather.ShardedArxiv.from_articles(arxiv_data.values(),
+                                                   2) as sharded:
+        assert len(sharded) == len(arxiv_data)
+        assert sharded.contains_keyword('pebble') == \
+            arxiv_functions.contains_keyword(arxiv_data, 'pebble')
+
+
+def test_failed_query_leaves_no_stale_replies(arxiv_data) -> None:
+    """Test that a query that fails in the workers does not change the
+    results of the queries after it.
+    """
+    with scatter_gather.ShardedArxiv.from_articles(arxiv_data.values(),
+                                                   3) as sharded:
+        with pytest.raises(TypeError):
+            sharded.contains_keyword(None)
+        assert len(sharded) == len(arxiv_data)
+        assert sharded.contains_keyword('the') == \
+            arxiv_functions.contains_keyword(arxiv_data, 'the')
+
+
+def test_load_failure_stops_workers() -> None:
+    """Test that a failure while loading articles stops the workers."""
+    def articles():
+        yield {ID: '1'}
+        raise ValueError('bad record')
+
+    started = len(multiprocessing.active_children())
+    with pytest.raises(ValueError):
+        scatter_gather.ShardedArxiv.from_articles(articles(), 2)
+    assert len(multiprocessing.active_children()) == started
+
+
+def test_close_after_worker_died() -> None:
+    """Test that close stops every worker even if one has already died."""
+    started = len(multiprocessing.active_children())
+    sharded = scatter_gather.ShardedArxiv.from_articles(
+        arxiv_functions.EXAMPLE_ARXIV.values(), 3)
+    sharded._processes[0].kill()
+    sharded._processes[0].join()
+    sharded.close()
+    assert len(multiprocessing.active_children()) == started
+
+
+def test_empty_corpus() -> None:
+    """Test queries over workers with no articles."""
+    with scatter_gather.ShardedArxiv.from_articles([], 2) as sharded:
+        assert len(sharded) == 0
+        assert sharded.average_author_count() == 0.0
+        assert sharded.contains_keyword('the') == []
+        assert sharded.make_author_to_articles() == {}
+
+
+def test_shards_partition_ids(arxiv_data) -> None:
+    """Test that every ID is assigned to exactly one valid shard."""
+    counts = [0] * 4
+    for article_id in arxiv_data:
+        counts[scatter_gather.shard_of(article_id, 4)] += 1
+    assert sum(counts) == len(arxiv_data)
+    assert min(counts) > 0
+
+
+if __name__ == '__main__':
+    pytest.main(['test_scatter_gather.py'])
@@ -0,0 +1,83 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for shards and its Bloom filters.
+"""
+
+import os
+import pytest
+import arxiv_functions
+import shards
+import sketches
+
+
+def _write_shards(data_path: str, directory, count: int) -> list:
+    """Split the file at data_path into count shard files in directory and
+    return the shard paths.
+    """
+    with open(data_path) as f:
+        text = f.read()
+    records = [record + 'END\n' for record in text.split('END\n')[:-1]]
+    paths = []
+    for i in range(count):
+        path = os.path.join(str(directory), 'shard{}.txt'.format(i))
+        with open(path, 'w') as f:
+            f.write(''.join(records[i::count]))
+        paths.append(path)
+    return paths
+
+
+def test_pruned_queries_match_unsharded(tmp_path, arxiv_data,
+                                        data_path) -> None:
+    """Test that sharded queries give the same results as the whole corpus
+    and that rare terms prune most shards.
+    """
+    paths = _write_shards(data_path, tmp_path, 20)
+    corpus = shards.ShardedCorpus(paths)
+    for path in paths:
+        assert os.path.exists(path + shards.BLOOM_SUFFIX)
+
+    for keyword in ['the', 'pebble', 'notaword']:
+        expected = arxiv_functions.contains_keyword(arxiv_data, keyword)
+        assert corpus.contains_keyword(keyword) == expected
+    assert corpus.last_stats().shards == 20
+    assert corpus.last_stats().pruned >= 18
+    assert corpus.history[0].pruned == 0
+
+    for author in [('Chablat', 'Damien'), ('Streinu', 'Ileana')]:
+        assert corpus.get_coauthors(author) == \
+            arxiv_functions.get_coauthors(arxiv_data, author)
+    assert corpus.last_stats().pruned >= 18
+
+
+def test_saved_filters_are_reused(tmp_path, data_path) -> None:
+    """Test that a saved filter is loaded rather than rebuilt when it was
+    built for the requested rate, and rebuilt when it was not.
+    """
+    paths = _write_shards(data_path, tmp_path, 2)
+    bloom = shards.read_shard(paths[0], 0.001)[1]
+    loaded = shards.load_shard_filter(paths[0], 0.001)
+    assert (loaded.bits, loaded.hashes) == (bloom.bits, bloom.hashes)
+    assert loaded.to_bytes() == bloom.to_bytes()
+
+    rebuilt = shards.load_shard_filter(paths[0], 0.5)
+    assert rebuilt.false_positive_rate == 0.5
+    assert rebuilt.bits < bloom.bits
+    assert shards.load_shard_filter(paths[0], 0.5).to_bytes() == \
+        rebuilt.to_bytes()
+
+
+def test_bloom_false_positive_rate() -> None:
+    """Test that a filter holds its words and stays near its configured
+    false-positive rate.
+    """
+    bloom = sketches.BloomFilter.with_rate(2000, 0.02)
+    for i in range(2000):
+        bloom.add('word{}'.format(i))
+    assert all(bloom.might_contain('word{}'.format(i)) for i in range(2000))
+    false_positives = sum(bloom.might_contain('other{}'.format(i))
+                          for i in range(10000))
+    assert false_positives < 0.04 * 10000
+
+
+if __name__ == '__main__':
+    pytest.main(['test_shards.py'])
@@ -0,0 +1,83 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for similarity.
+"""
+
+import math
+import pytest
+import arxiv_functions
+import similarity
+
+
+def _brute_force(index: similarity.SimilarityIndex, article_id: str,
+                 k: int) -> list:
+    """Return the k most similar articles to article_id by comparing it
+    against every other article.
+    """
+    vector = index._vectors[article_id]
+    scores = []
+    for other_id, other in index._vectors.items():
+        if other_id == article_id or index._norms[other_id] == 0.0:
+            continue
+        dot = sum(weight * other.get(word, 0.0)
+                  for word, weight in vector.items())
+        if dot > 0:
+            scores.append((-dot / (index._norms[article_id] *
+                                   index._norms[other_id]), other_id))
+    return [(-score, other_id) for score, other_id in sorted(scores)[:k]]
+
+
+def test_matches_brute_force(arxiv_data) -> None:
+    """Test most_similar against comparing with every article."""
+    index = similarity.SimilarityIndex(arxiv_data)
+    for article_id in sorted(arxiv_data)[:25]:
+        actual = index.most_similar(article_id, 5)
+        expected = _brute_force(index, article_id, 5)
+        assert [i for _, i in actual] == [i for _, i in expected]
+        for (score, _), (expected_score, _) in zip(actual, expected):
+            assert math.isclose(score, expected_score)
+
+
+def test_common_words_pruned(arxiv_data) -> None:
+    """Test that words in most articles are left out of the index, so a
+    query scores only part of the corpus.
+    """
+    index = similarity.SimilarityIndex(arxiv_data)
+    assert 'the' not in index._postings
+    for article_id in sorted(arxiv_data)[:25]:
+        index.most_similar(article_id, 5)
+        assert index.last_scored < 0.9 * len(arxiv_data)
+
+
+def test_small_corpus_keeps_words() -> None:
+    """Test that the default max_df does not empty the index of a corpus
+    with only a few articles.
+    """
+    index = similarity.SimilarityIndex(arxiv_functions.EXAMPLE_ARXIV)
+    neighbours = index.all_neighbours(3)
+    assert sum(len(similar) for similar in neighbours.values()) > 0
+    assert [i for _, i in neighbours['108']][:2] == ['5090', '0001']
+
+
+def test_unknown_article() -> None:
+    """Test most_similar for an ID that is not indexed."""
+    index = similarity.SimilarityIndex(arxiv_functions.EXAMPLE_ARXIV)
+    assert index.most_similar('nope', 3) == []
+
+
+def test_all_neighbours_memory_budget() -> None:
+    """Test that a memory budget stops the batch early and that the rest can
+    be resumed.
+    """
+    index = similarity.SimilarityIndex(arxiv_functions.EXAMPLE_ARXIV)
+    everything = index.all_neighbours(2)
+    assert sorted(everything) == sorted(arxiv_functions.EXAMPLE_ARXIV)
+
+    first = index.all_neighbours(2, memory_budget=600)
+    assert 0 < len(first) < len(everything)
+    rest = index.neighbours_from(max(first), 2)
+    assert {**first, **rest} == everything
+
+
+if __name__ == '__main__':
+    pytest.main(['test_similarity.py'])
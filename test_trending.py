@@ -0,0 +1,83 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Tests for sketches and trending.
+"""
+
+import pytest
+import arxiv_functions
+import sketches
+import trending
+from constants import ID, TITLE, CREATED, ABSTRACT
+
+
+def _article(article_id: str, created: str, abstract: str) -> dict:
+    """Return an article with the given ID, CREATED date and abstract."""
+    return {ID: article_id, TITLE: '', CREATED: created, ABSTRACT: abstract}
+
+
+def test_sketch_never_underestimates(data_path) -> None:
+    """Test Count-Min estimates against exact counts of data.txt words."""
+    with open(data_path) as f:
+        words = [arxiv_functions.clean_word(word) for word in f.read().split()]
+    words = [word for word in words if word]
+    sketch = sketches.CountMinSketch.with_error(0.001, 0.01)
+    exact = {}
+    for word in words:
+        sketch.add(word)
+        exact[word] = exact.get(word, 0) + 1
+    for word, count in exact.items():
+        assert count <= sketch.estimate(word) <= count + 0.001 * len(words)
+
+
+def test_heavy_hitters_find_most_frequent() -> None:
+    """Test that the tracked words are the most frequent ones."""
+    top = sketches.HeavyHitters(3, sketches.CountMinSketch(1000, 5))
+    for word, count in [('a', 50), ('b', 40), ('c', 30), ('d', 5), ('e', 2)]:
+        for _ in range(count):
+            top.add(word)
+    for word in 'vwxyz':
+        top.add(word)
+    assert top.top() == [('a', 50), ('b', 40), ('c', 30)]
+
+
+def test_rising_terms_between_years() -> None:
+    """Test the rising terms of each year against the previous year."""
+    articles = [_article('1', '2020-01-01', 'graph graph theory'),
+                _article('2', '2021-05-05', 'quantum quantum graph'),
+                _article('3', '2021-06-06', 'Quantum! theory'),
+                _article('4', '', 'undated quantum')]
+    job = trending.trending_terms(articles, k=10)
+    assert job.years() == [2020, 2021]
+    assert job.top_terms(2021, 1) == [('quantum', 3)]
+    assert [word for word, _ in job.rising(2021, 5)] == ['quantum']
+    assert list(job.rising_by_year(5)) == [2021]
+
+
+def test_merge_matches_single_pass() -> None:
+    """Test that merged per-shard jobs give the single-pass results."""
+    articles = [_article(str(i), '202{}-01-01'.format(i % 3),
+                         'word{} common'.format(i % 7)) for i in range(60)]
+    whole = trending.trending_terms(articles, k=5)
+    left = trending.trending_terms(articles[:25], k=5)
+    left.merge(trending.trending_terms(articles[25:], k=5))
+    for year in whole.years():
+        assert left.top_terms(year, 5) == whole.top_terms(year, 5)
+    assert left.rising_by_year(3) == whole.rising_by_year(3)
+
+
+def test_merge_copies_and_checks_parameters() -> None:
+    """Test that merge leaves the other job unchanged and unshared, and
+    rejects a job built with different parameters.
+    """
+    other = trending.trending_terms([_article('1', '2021-01-01', 'quantum')])
+    job = trending.TrendingTerms()
+    job.merge(other)
+    job.add_article(_article('2', '2021-01-01', 'quantum quantum'))
+    assert other.top_terms(2021, 1) == [('quantum', 1)]
+    assert job.top_terms(2021, 1) == [('quantum', 3)]
+    with pytest.raises(ValueError):
+        job.merge(trending.TrendingTerms(k=5))
+
+
+if __name__ == '__main__':
+    pytest.main(['test_trending.py'])
@@ -0,0 +1,142 @@
+"""CSC108: Fall 2023 -- Assignment 3: arxiv.org
+
+Trending terms per created year, computed in one streaming pass with
+bounded memory: each year keeps a Count-Min sketch of its word counts and
+the heavy hitters of that sketch.
+"""
+
+from typing import Iterable, Union
+
+from arxiv_functions import clean_word, text_words
+from constants import TITLE, CREATED, ABSTRACT, ArticleType, ArxivType
+from sketches import CountMinSketch, HeavyHitters
+
+
+class TrendingTerms:
+    """Approximate word counts of titles and abstracts per CREATED year.
+
+    Words are the words of the title and abstract, as given by text_words.
+    Unlike contains_keyword, author names are not counted. Articles without
+    a CREATED year are skipped. Memory per year is fixed by epsilon, delta
+    and k, whatever the number of articles.
+
+    _years maps each year seen to the HeavyHitters of its sketch.
+    """
+    epsilon: float
+    delta: float
+    k: int
+    _years: dict[int, HeavyHitters]
+
+    def __init__(self, epsilon: float = 0.0005, delta: float = 0.01,
+                 k: int = 200) -> None:
+        """Initialize an empty job whose per-year count estimates are within
+        epsilon times that year's word count with probability 1 - delta,
+        tracking the k most frequent words of each year.
+        """
+        self.epsilon = epsilon
+        self.delta = delta
+        self.k = k
+        self._years = {}
+
+    def add_article(self, article: ArticleType) -> None:
+        """Count the words of article under its CREATED year."""
+        created = article[CREATED]
+        if not created[:4].isdigit():
+            return
+        year = int(created[:4])
+        if year not in self._years:
+            self._years[year] = HeavyHitters(
+                self.k, CountMinSketch.with_error(self.epsilon, self.delta))
+        top = self._years[year]
+        for word in text_words(article):
+            top.add(word)
+
+    def merge(self, other: 'TrendingTerms') -> None:
+        """Merge other, built with the same parameters over other articles,
+        into this job. other is not changed, and nothing in this job is
+        shared with it afterwards.
+
+        >>> first = TrendingTerms(k=5)
+        >>> first.add_article({CREATED: '2023-01-01', TITLE: 'Cats',
+        ...                    ABSTRACT: 'cats'})
+        >>> second = TrendingTerms(k=5)
+        >>> second.merge(first)
+        >>> second.add_article({CREATED: '2023-01-01', TITLE: 'Cats',
+        ...                     ABSTRACT: ''})
+        >>> first.top_terms(2023, 1), second.top_terms(2023, 1)
+        ([('cats', 2)], [('cats', 3)])
+        """
+        if (self.epsilon, self.delta, self.k) != \
+                (other.epsilon, other.delta, other.k):
+            raise ValueError('cannot merge jobs with different parameters')
+        for year, top in other._years.items():
+            if year not in self._years:
+                self._years[year] = HeavyHitters(
+                    self.k, CountMinSketch(top.sketch.width,
+                                           top.sketch.depth))
+            self._years[year].merge(top)
+
+    def years(self) -> list[int]:
+        """Return the years seen, in increasing order."""
+        return sorted(self._years)
+
+    def top_terms(self, year: int, n: int) -> list[tuple[str, int]]:
+        """Return up to n of the most frequent words of year with their
+        estimated counts, most frequent first.
+        """
+        if year not in self._years:
+            return []
+        return self._years[year].top()[:n]
+
+    def frequency(self, year: int, word: str) -> float:
+        """Return the estimated share of the words of year that are word,
+        or 0.0 if no words were counted for year.
+        """
+        if year not in self._years or self._years[year].sketch.total == 0:
+            return 0.0
+        sketch = self._years[year].sketch
+        return sketch.estimate(clean_word(word)) / sketch.total
+
+    def rising(self, year: int, n: int) -> list[tuple[str, float]]:
+        """Return up to n of the top words of year whose frequency rose the
+        most since the closest earlier year seen, with the rise in
+        frequency, largest first. Return [] if there is no earlier year.
+
+        >>> from arxiv_functions import EXAMPLE_ARXIV
+        >>> job = trending_terms(EXAMPLE_ARXIV)
+        >>> job.years()
+        [2023]
+        >>> job.rising(2023, 3)
+        []
+        """
+        earlier = [seen for seen in self._years if seen < year]
+        if year not in self._years or not earlier:
+            return []
+        previous = max(earlier)
+        rises = []
+        for word, _ in self._years[year].top():
+            rise = self.frequency(year, word) - self.frequency(previous, word)
+            if rise > 0:
+                rises.append((word, rise))
+        rises.sort(key=lambda item: (-item[1], item[0]))
+        return rises[:n]
+
+    def rising_by_year(self, n: int) -> dict[int, list[tuple[str, float]]]:
+        """Return a dict that maps each year seen after the first to
+        rising(year, n).
+        """
+        return {year: self.rising(year, n) for year in self.years()[1:]}
+
+
+def trending_terms(articles: Union[ArxivType, Iterable[ArticleType]],
+                   epsilon: float = 0.0005, delta: float = 0.01,
+                   k: int = 200) -> TrendingTerms:
+    """Return the TrendingTerms of articles, an ArxivType or an iterable of
+    articles such as read_arxiv_records(f), computed in a single pass.
+    """
+    if isinstance(articles, dict):
+        articles = articles.values()
+    job = TrendingTerms(epsilon, delta, k)
+    for article in articles:
+        job.add_article(article)
+    return job